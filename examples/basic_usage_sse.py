@@ -8,6 +8,7 @@ This example demonstrates:
 1. Creating a client directly or loading from configuration file
 2. Using the client to interact with an SSE-based MCP server
 3. Working with MCP resources (listing, reading, subscribing)
+4. Handling connection errors and closing the client deterministically
 
 ** Make sure your math_server_sse.py is running before running this example:
    python servers/math_server_sse.py
@@ -15,118 +16,200 @@ This example demonstrates:
 NOTE: This example uses async/await as the official MCP library is async-only.
 """
 
-import os
+import time
+import socket
 import asyncio
 import logging
-import base64
-from typing import Dict, Any, Optional
+from typing import Dict, Any
+from urllib.parse import urlsplit
 
 from mcpwire import (
     MCPClient,
     MCPError,
     MCPAPIError,
     MCPConnectionError,
-    MCPTimeoutError
+    get_client
 )
 
+from _runtime import run, configure_logging
+
 # Set up logging - helps trace what's happening
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-async def example_direct_initialization():
-    """Example: Creating a client directly."""
+# Hosts that recently failed to resolve, mapped to (expires_at, reason), so
+# repeated attempts fail immediately instead of waiting on DNS again
+NEGATIVE_DNS_TTL = 10
+_failed_lookups: Dict[str, Any] = {}
+
+async def preflight_resolve(url: str, timeout: float = 0.5) -> None:
+    """Raise MCPConnectionError quickly if the URL's host can't be resolved."""
+    parts = urlsplit(url)
+    host = parts.hostname
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+
+    cached = _failed_lookups.get(host)
+    if cached and time.monotonic() < cached[0]:
+        raise MCPConnectionError(f"Could not resolve host '{host}' (cached): {cached[1]}")
+
+    try:
+        await asyncio.wait_for(asyncio.get_running_loop().getaddrinfo(host, port), timeout)
+    except (socket.gaierror, asyncio.TimeoutError) as e:
+        reason = str(e) or "lookup timed out"
+        _failed_lookups[host] = (time.monotonic() + NEGATIVE_DNS_TTL, reason)
+        raise MCPConnectionError(f"Could not resolve host '{host}': {reason}") from e
+
+async def example_direct_initialization(mcp: MCPClient):
+    """Example: Using a directly created client."""
     logger.info("\n=== Example: Direct Initialization with SSE ===\n")
     try:
-        # Create a client with direct initialization
-        client = MCPClient(
-            base_url="http://localhost:8000/sse",
-            transport="sse",
-            timeout=30,
-            api_key=None  # Optional API key
-        )
+        # List available tools
+        tools = await mcp.list_tools()
+        logger.info("Server provides %s tools", len(tools))
+        for tool in tools:
+            logger.info("Tool: %s - %s", tool.name, tool.description)
         
-        async with client as mcp:
-            # List available tools
-            tools = await mcp.list_tools()
-            logger.info(f"Server provides {len(tools)} tools")
-            for tool in tools:
-                logger.info(f"Tool: {tool.name} - {tool.description}")
-            
-            # Call the add tool from math_server_sse.py
-            try:
-                result = await mcp.call_tool("add", {"a": 5, "b": 7})
-                logger.info(f"Result of add(5, 7): {result}")
-            except Exception as e:
-                logger.error(f"Error calling 'add' tool: {e}")
-            
-            # Call the multiply tool from math_server_sse.py
-            try:
-                result = await mcp.call_tool("multiply", {"a": 6, "b": 8})
-                logger.info(f"Result of multiply(6, 8): {result}")
-            except Exception as e:
-                logger.error(f"Error calling 'multiply' tool: {e}")
+        # Call the add and multiply tools from math_server_sse.py in one batch
+        results = await mcp.call_batch([
+            ("tools/call", {"name": "add", "arguments": {"a": 5, "b": 7}}),
+            ("tools/call", {"name": "multiply", "arguments": {"a": 6, "b": 8}}),
+        ], return_exceptions=True)
+        for label, result in zip(["add(5, 7)", "multiply(6, 8)"], results):
+            if isinstance(result, Exception):
+                logger.error("Error calling %s: %s", label, result)
+            else:
+                logger.info("Result of %s: %s", label, result)
     
-    except MCPConnectionError as e:
-        logger.error(f"Connection error: {e}")
-        logger.info("Make sure math_server_sse.py is running at http://localhost:8000")
     except MCPError as e:
-        logger.error(f"MCP Client error: {e}")
+        logger.error("MCP Client error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
 async def example_config_file_initialization():
     """Example: Loading client config from mcp.json."""
     logger.info("\n=== Example: Config File Initialization with SSE ===\n")
     try:
         # Load configuration from mcp.json file
-        client = MCPClient.from_config(server_name="math_sse")
-        
-        async with client as mcp:
-            # Get server metadata
-            try:
-                metadata = await mcp.get_server_metadata()
-                logger.info(f"Connected to server from config: {metadata.name} v{metadata.version}")
-            except Exception as e:
-                logger.error(f"Error getting server metadata: {e}")
-                logger.info("Continuing with tool listing...")
-            
-            # List available tools
-            tools = await mcp.list_tools()
-            logger.info(f"Server provides {len(tools)} tools")
+        async with MCPClient.from_config(server_name="math_sse") as mcp:
+            # Metadata and tool listing are independent, so fetch them concurrently
+            metadata, tools = await asyncio.gather(
+                mcp.get_server_metadata(),
+                mcp.list_tools(),
+                return_exceptions=True
+            )
+            if isinstance(metadata, Exception):
+                logger.error("Error getting server metadata: %s", metadata)
+            else:
+                logger.info("Connected to server from config (MCP version: %s)", metadata.mcp_version or 'unknown')
+            if isinstance(tools, Exception):
+                raise tools
+            logger.info("Server provides %s tools", len(tools))
             
             # Call tools
             for tool in tools:
-                logger.info(f"Found tool: {tool.name} - {tool.description}")
+                logger.info("Found tool: %s - %s", tool.name, tool.description)
                 
             # Try to call some tools
             try:
                 result = await mcp.call_tool("add", {"a": 10, "b": 20})
-                logger.info(f"Result of add(10, 20): {result}")
+                logger.info("Result of add(10, 20): %s", result)
             except Exception as e:
-                logger.error(f"Error calling 'add' tool: {e}")
+                logger.error("Error calling 'add' tool: %s", e)
             
     except FileNotFoundError:
         logger.error("mcp.json file not found in standard locations.")
         logger.info("Create an mcp.json file in the current directory or ~/.mcp.json")
     except KeyError as e:
-        logger.error(f"Server configuration not found: {e}")
+        logger.error("Server configuration not found: %s", e)
     except MCPError as e:
-        logger.error(f"MCP Client error: {e}")
+        logger.error("MCP Client error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
-async def run_all_examples():
-    """Run all examples in sequence."""
+async def example_resource_operations(mcp: MCPClient):
+    """Example: Discovering and reading resources."""
+    logger.info("\n=== Example: Resource Operations with SSE ===\n")
     try:
-        await example_direct_initialization()
-        await example_config_file_initialization()
+        # The discovery calls don't depend on each other, so issue them concurrently
+        tools, metadata = await asyncio.gather(
+            mcp.list_tools(),
+            mcp.get_server_metadata(),
+            return_exceptions=True
+        )
+        if isinstance(metadata, Exception):
+            logger.warning("Could not get server metadata: %s", metadata)
+        if isinstance(tools, Exception):
+            raise tools
+        logger.info("Server provides %s tools", len(tools))
+        
+        # Stream the resources page by page and read each one as it arrives
+        async for resource in mcp.iter_resources():
+            logger.info("Resource: %s (URI: %s)", resource.name, resource.uri)
+            try:
+                content = await mcp.read_resource(resource.uri)
+                for item in content.contents:
+                    if item.text:
+                        logger.info("  Content: %s", item.text[:50])
+            except MCPAPIError as e:
+                logger.error("  Error reading resource: %s", e)
+    
+    except MCPError as e:
+        logger.error("MCP Client error: %s", e)
     except Exception as e:
-        logger.error(f"Error running examples: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
-if __name__ == "__main__":
-    # Run the async examples
-    asyncio.run(run_all_examples())
+async def example_error_handling():
+    """Example: Handling a server that can't be reached."""
+    logger.info("\n=== Example: Error Handling ===\n")
+    # This host doesn't exist, so connecting will fail
+    url = "http://non-existent-server:8000/sse"
+    client = MCPClient(base_url=url, transport="sse", timeout=5)
+    try:
+        # Resolve the host first so a bad name fails in milliseconds rather
+        # than after a full connection attempt
+        await preflight_resolve(url)
+        await client.list_tools()
+    except MCPConnectionError as e:
+        logger.error("Connection error (expected): %s", e)
+    except MCPError as e:
+        logger.error("MCP Client error: %s", e)
+    except Exception as e:
+        logger.error("Could not reach the server (expected): %s", e)
+    finally:
+        # A failed connect can leave a half-open SSE stream behind; close it
+        # now rather than leaving it for garbage collection
+        await client.aclose()
 
+async def example_shared_session():
+    """Run the examples that talk to the local server over one pooled session."""
+    # Borrow a pooled client and share its SSE session between the examples
+    # that talk to the same server, so the connection handshake happens once
+    try:
+        async with get_client("http://localhost:8000/sse", "sse", timeout=30) as mcp:
+            # Once connected, the session can carry both examples' requests at once
+            await asyncio.gather(
+                example_direct_initialization(mcp),
+                example_resource_operations(mcp),
+                return_exceptions=True
+            )
+    except MCPConnectionError as e:
+        logger.error("Connection error: %s", e)
+        logger.info("Make sure math_server_sse.py is running at http://localhost:8000")
+
+async def run_all_examples():
+    """Run all examples concurrently."""
+    # The examples are independent (the config file example builds its own
+    # client from mcp.json), so total runtime is that of the slowest one
+    results = await asyncio.gather(
+        example_shared_session(),
+        example_config_file_initialization(),
+        example_error_handling(),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Error running examples: %s", result, exc_info=result)
+
+if __name__ == "__main__":
+    # Run on uvloop when it's installed
+    run(run_all_examples())
@@ -16,87 +16,76 @@ This example demonstrates working with MCP resources:
 NOTE: This example uses async/await as the official MCP library is async-only.
 """
 
-import os
 import asyncio
 import logging
-import json
 import time
-import base64
-from typing import Dict, Any, Optional
 
 from mcpwire import (
-    MCPClient,
     MCPError,
-    MCPAPIError,
     MCPConnectionError,
-    MCPTimeoutError
+    get_client
 )
 
+from _runtime import run, bounded_gather, configure_logging
+
 # Set up logging - helps trace what's happening
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 async def demonstrate_resources():
     """Demonstrate working with resources."""
     logger.info("\n=== MCP Resources Demo with SSE ===\n")
     try:
-        # Create a client with direct initialization
-        client = MCPClient(
-            base_url="http://localhost:8000/sse",
-            transport="sse",
-            timeout=30
-        )
-        
-        async with client as mcp:
+        # Borrow a client from the connection pool
+        async with get_client("http://localhost:8000/sse", "sse", timeout=30) as mcp:
             # Step 1: List available resources and templates
             resources_result = await mcp.list_resources()
-            logger.info(f"Found {len(resources_result.resources)} resources and {len(resources_result.templates or [])} templates")
+            logger.info("Found %s resources and %s templates", len(resources_result.resources), len(resources_result.templates or []))
             
             # Display available resources
             for resource in resources_result.resources:
-                logger.info(f"Resource: {resource.name} (URI: {resource.uri})")
+                logger.info("Resource: %s (URI: %s)", resource.name, resource.uri)
             
             # Display available templates
             if resources_result.templates and len(resources_result.templates) > 0:
                 logger.info("Available templates:")
                 for template in resources_result.templates:
-                    logger.info(f"Template: {template.name} (URI Template: {template.uri_template})")
+                    logger.info("Template: %s (URI Template: %s)", template.name, template.uri_template)
             else:
                 logger.info("No resource templates available from this server")
             
             # Step 2: Call some tools to generate data for resources
             logger.info("\n--- Making calculations to update resources ---")
-            await mcp.call_tool("add", {"a": 10, "b": 20})
-            logger.info("Called add(10, 20)")
-            
-            await mcp.call_tool("multiply", {"a": 5, "b": 6})
-            logger.info("Called multiply(5, 6)")
+            # Both calculations are independent, so issue them concurrently
+            await asyncio.gather(
+                mcp.call_tool("add", {"a": 10, "b": 20}),
+                mcp.call_tool("multiply", {"a": 5, "b": 6})
+            )
+            logger.info("Called add(10, 20) and multiply(5, 6)")
             
             # Step 3: Read resource content
             logger.info("\n--- Reading resources ---")
             try:
-                # Read calculation history
-                history = await mcp.read_resource("calc://history")
+                # Read the calculation history and current result together
+                history, current = await bounded_gather((
+                    mcp.read_resource("calc://history"),
+                    mcp.read_resource("calc://current"),
+                ))
                 for item in history.contents:
                     if item.text:
-                        logger.info(f"Calculation history:\n{item.text}")
+                        logger.info("Calculation history:\n%s", item.text)
                 
-                # Read current result
-                current = await mcp.read_resource("calc://current")
                 for item in current.contents:
                     if item.text:
-                        logger.info(f"Current calculation result: {item.text}")
+                        logger.info("Current calculation result: %s", item.text)
             except Exception as e:
-                logger.error(f"Error reading resources: {e}")
+                logger.error("Error reading resources: %s", e)
             
             # Step 4: Subscribe to resources for updates
             logger.info("\n--- Subscribing to resources for updates ---")
             try:
-                # Check if subscription is supported
-                if hasattr(mcp._mcpwire, 'subscribe_to_resource'):
+                # Check whether the server advertised resource subscriptions
+                if mcp.supports("resources/subscribe"):
                     # Subscribe to current calculation updates
                     await mcp.subscribe_to_resource("calc://current")
                     logger.info("Subscribed to current calculation updates")
@@ -110,13 +99,13 @@ async def demonstrate_resources():
                     updated = await mcp.read_resource("calc://current")
                     for item in updated.contents:
                         if item.text:
-                            logger.info(f"Updated calculation result: {item.text}")
+                            logger.info("Updated calculation result: %s", item.text)
                     
                     # Read history again to see all calculations
                     history = await mcp.read_resource("calc://history")
                     for item in history.contents:
                         if item.text:
-                            logger.info(f"Updated calculation history:\n{item.text}")
+                            logger.info("Updated calculation history:\n%s", item.text)
                             
                     # Unsubscribe when done
                     await mcp.unsubscribe_from_resource("calc://current")
@@ -133,41 +122,41 @@ async def demonstrate_resources():
                     updated = await mcp.read_resource("calc://current")
                     for item in updated.contents:
                         if item.text:
-                            logger.info(f"Updated calculation result: {item.text}")
+                            logger.info("Updated calculation result: %s", item.text)
                     
                     # Read history again to see all calculations
                     history = await mcp.read_resource("calc://history")
                     for item in history.contents:
                         if item.text:
-                            logger.info(f"Updated calculation history:\n{item.text}")
+                            logger.info("Updated calculation history:\n%s", item.text)
             except Exception as e:
-                logger.error(f"Error with resource subscription: {e}")
+                logger.error("Error with resource subscription: %s", e)
             
             # Step 5: Use a resource template
             logger.info("\n--- Using resource templates ---")
             try:
                 # Use the timestamp template
-                current_timestamp = int(time.time())
+                current_timestamp = time.time_ns() // 1_000_000_000
                 timestamp_uri = f"calc://timestamp/{current_timestamp}"
-                logger.info(f"Using template with URI: {timestamp_uri}")
+                logger.info("Using template with URI: %s", timestamp_uri)
                 
-                timestamp_data = await mcp.read_resource(timestamp_uri)
+                # The server marks this resource as application/json, so let
+                # the client decode it
+                timestamp_data = await mcp.read_resource(timestamp_uri, parse=True)
                 for item in timestamp_data.contents:
-                    if item.text:
-                        # Parse JSON response
-                        data = json.loads(item.text)
-                        logger.info(f"Template data: {data}")
+                    if item.data is not None:
+                        logger.info("Template data: %s", item.data)
             except Exception as e:
-                logger.error(f"Error using template: {e}")
+                logger.error("Error using template: %s", e)
             
     except MCPConnectionError as e:
-        logger.error(f"Connection error: {e}")
+        logger.error("Connection error: %s", e)
         logger.info("Make sure math_server_sse.py is running at http://localhost:8000")
     except MCPError as e:
-        logger.error(f"MCP Client error: {e}")
+        logger.error("MCP Client error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
 if __name__ == "__main__":
-    # Run the async example
-    asyncio.run(demonstrate_resources()) 
\ No newline at end of file
+    # Run on uvloop when it's installed
+    run(demonstrate_resources())
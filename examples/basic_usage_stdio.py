@@ -16,11 +16,10 @@ import asyncio
 import logging
 from mcpwire import MCPClient, MCPError
 
+from _runtime import run, configure_logging
+
 # Set up logging - helps trace what's happening
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 async def main():
@@ -28,40 +27,40 @@ async def main():
     logger.info("\n=== Stdio MCP Server Example ===\n")
     try:
         # Load the client from the mcp.json config
-        client = MCPClient.from_config(server_name="math_stdio")
-        
-        async with client as mcp:
+        async with MCPClient.from_config(server_name="math_stdio") as mcp:
+            # The server process is started on entering the block; one ping
+            # confirms it responds and gives a baseline round-trip time
+            rtt = await mcp.ping()
+            logger.info("Server process ready (ping %.1f ms)", rtt * 1000)
+            
             # List available tools
             tools = await mcp.list_tools()
-            logger.info(f"Server provides {len(tools)} tools")
+            logger.info("Server provides %s tools", len(tools))
             for tool in tools:
-                logger.info(f"Tool: {tool.name} - {tool.description}")
-            
-            # Call the hello tool
-            try:
-                result = await mcp.call_tool("hello", {"name": "World"})
-                logger.info(f"Result of hello('World'): {result}")
-            except Exception as e:
-                logger.error(f"Error calling 'hello' tool: {e}")
+                logger.info("Tool: %s - %s", tool.name, tool.description)
             
-            # Call the add tool
-            try:
-                result = await mcp.call_tool("add", {"a": 5, "b": 7})
-                logger.info(f"Result of add(5, 7): {result}")
-            except Exception as e:
-                logger.error(f"Error calling 'add' tool: {e}")
-                
-            # Call the multiply tool
-            try:
-                result = await mcp.call_tool("multiply", {"a": 6, "b": 8})
-                logger.info(f"Result of multiply(6, 8): {result}")
-            except Exception as e:
-                logger.error(f"Error calling 'multiply' tool: {e}")
+            # The tool calls are independent, so run them concurrently. Each
+            # failure is still reported for its own call.
+            calls = {
+                "hello('World')": ("hello", {"name": "World"}),
+                "add(5, 7)": ("add", {"a": 5, "b": 7}),
+                "multiply(6, 8)": ("multiply", {"a": 6, "b": 8}),
+            }
+            results = await asyncio.gather(
+                *(mcp.call_tool(name, arguments) for name, arguments in calls.values()),
+                return_exceptions=True
+            )
+            for (label, (name, _)), result in zip(calls.items(), results):
+                if isinstance(result, Exception):
+                    logger.error("Error calling '%s' tool: %s", name, result)
+                else:
+                    logger.info("Result of %s: %s", label, result)
     
     except MCPError as e:
-        logger.error(f"MCP Client error: {e}")
+        logger.error("MCP Client error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Run on uvloop when it's installed
+    run(main())
@@ -13,16 +13,15 @@ This example demonstrates:
 import asyncio
 import logging
 from mcpwire import (
-    MCPClient,
     MCPError,
-    MCPConnectionError
+    MCPConnectionError,
+    get_client
 )
 
+from _runtime import run, bounded_gather, configure_logging
+
 # Set up logging - helps trace what's happening
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 async def use_math_server():
@@ -30,34 +29,52 @@ async def use_math_server():
     logger.info("\n=== Math Server Example ===\n")
     
     try:
-        # Create a client connected to the math server
-        client = MCPClient(
-            base_url="http://localhost:8000/sse",
-            transport="sse",
-            timeout=30
-        )
-        
-        async with client as mcp:
+        # Borrow a client connected to the math server from the connection pool
+        async with get_client("http://localhost:8000/sse", "sse", timeout=30) as mcp:
+            # One round trip up front, so the work below starts on a warm
+            # connection, and a baseline latency to compare it against
+            rtt = await mcp.ping()
+            logger.info("Connected (ping %.1f ms)", rtt * 1000)
+            
             # List available math tools
             tools = await mcp.list_tools()
-            logger.info(f"Math server provides {len(tools)} tools:")
+            logger.info("Math server provides %s tools:", len(tools))
             for tool in tools:
-                logger.info(f"  - {tool.name}: {tool.description}")
+                logger.info("  - %s: %s", tool.name, tool.description)
             
-            # Call the add tool
-            add_result = await mcp.call_tool("add", {"a": 5, "b": 7})
-            logger.info(f"5 + 7 = {add_result.content[0].text}")
+            # The tool calls are independent, so send them all at once over the session
+            add_result, multiply_result = await asyncio.gather(
+                mcp.call_tool("add", {"a": 5, "b": 7}),
+                mcp.call_tool("multiply", {"a": 6, "b": 8})
+            )
+            logger.info("5 + 7 = %s", add_result.content[0].text)
+            logger.info("6 × 8 = %s", multiply_result.content[0].text)
             
-            # Call the multiply tool
-            multiply_result = await mcp.call_tool("multiply", {"a": 6, "b": 8})
-            logger.info(f"6 × 8 = {multiply_result.content[0].text}")
-            
-            # Try different numbers
-            for i in range(1, 5):
-                for j in range(1, 5):
-                    add_result = await mcp.call_tool("add", {"a": i, "b": j})
-                    multiply_result = await mcp.call_tool("multiply", {"a": i, "b": j})
-                    logger.info(f"{i} + {j} = {add_result.content[0].text}, {i} × {j} = {multiply_result.content[0].text}")
+            # Try different numbers. The results come back in the same order as
+            # the operations, one add and one multiply per pair
+            pairs = [(i, j) for i in range(1, 5) for j in range(1, 5)]
+            ops = [{"op": op, "a": i, "b": j} for i, j in pairs for op in ("add", "multiply")]
+            results = None
+            if any(tool.name == "batch" for tool in tools):
+                # The server can run them all in a single call: one request
+                # instead of 32
+                batch_result = await mcp.call_tool("batch", {"ops": ops})
+                if batch_result.isError:
+                    error_text = " ".join(getattr(item, "text", "") for item in batch_result.content)
+                    logger.warning("Batch call failed, falling back to individual calls: %s", error_text)
+                else:
+                    results = [item.text for item in batch_result.content]
+            if results is None:
+                # Otherwise the 32 calls run concurrently, capped so a larger
+                # grid can't flood the server
+                call_results = await bounded_gather(
+                    mcp.call_tool(o["op"], {"a": o["a"], "b": o["b"]}) for o in ops
+                )
+                results = [result.content[0].text for result in call_results]
+            # Skip walking the results entirely when INFO logging is off
+            if logger.isEnabledFor(logging.INFO):
+                for (i, j), add_result, multiply_result in zip(pairs, results[::2], results[1::2]):
+                    logger.info("%d + %d = %s, %d × %d = %s", i, j, add_result, i, j, multiply_result)
             
             # Work with resources
             logger.info("\n=== Math Server Resources ===\n")
@@ -65,65 +82,92 @@ async def use_math_server():
             try:
                 # List available resources
                 resources = await mcp.list_resources()
-                logger.info(f"Math server provides {len(resources.resources)} resources and {len(resources.templates or [])} templates")
+                logger.info("Math server provides %s resources and %s templates", len(resources.resources), len(resources.templates or []))
                 
-                # Display resources
-                for resource in resources.resources:
-                    logger.info(f"Resource: {resource.name} (URI: {resource.uri})")
-                    
-                    # Read the resource
-                    try:
-                        content = await mcp.read_resource(resource.uri)
-                        for item in content.contents:
-                            if item.text:
-                                logger.info(f"  Content: {item.text[:50]}...")
-                            elif item.blob:
-                                logger.info(f"  Binary content: {len(item.blob)} bytes")
-                        
-                        # Subscribe to the resource
-                        await mcp.subscribe_to_resource(resource.uri)
-                        logger.info(f"  Subscribed to {resource.name}")
-                        
-                        # Unsubscribe when done
-                        await mcp.unsubscribe_from_resource(resource.uri)
-                        logger.info(f"  Unsubscribed from {resource.name}")
-                    except Exception as e:
-                        logger.error(f"  Error reading resource: {e}")
+                # Read every resource at once; failures come back in place of
+                # their content so each resource is still reported on its own
+                contents = await bounded_gather(
+                    (mcp.read_resource(resource.uri) for resource in resources.resources),
+                    return_exceptions=True
+                )
+                readable = []
+                for resource, content in zip(resources.resources, contents):
+                    logger.info("Resource: %s (URI: %s)", resource.name, resource.uri)
+                    if isinstance(content, Exception):
+                        logger.error("  Error reading resource: %s", content)
+                        continue
+                    readable.append(resource)
+                    for item in content.contents:
+                        if item.text:
+                            logger.info("  Content: %s...", item.text[:50])
+                        elif item.blob:
+                            # The decoded size follows from the base64 length and its
+                            # padding, so there's no need to decode just to measure it
+                            binary_size = len(item.blob) * 3 // 4 - item.blob.count('=', -2)
+                            logger.info("  Binary content: %s bytes", binary_size)
+                
+                # Subscribe to the readable resources together, then unsubscribe
+                # from the ones that subscribed successfully. Only try when the
+                # server advertised subscriptions; otherwise nothing is subscribed
+                if not mcp.supports("resources/subscribe"):
+                    logger.info("Resource subscriptions not supported by this server")
+                else:
+                    subscribed = []
+                    results = await bounded_gather(
+                        (mcp.subscribe_to_resource(resource.uri) for resource in readable),
+                        return_exceptions=True
+                    )
+                    for resource, result in zip(readable, results):
+                        if isinstance(result, Exception):
+                            logger.error("  Error subscribing to %s: %s", resource.name, result)
+                        else:
+                            logger.info("  Subscribed to %s", resource.name)
+                            subscribed.append(resource)
+                
+                    results = await bounded_gather(
+                        (mcp.unsubscribe_from_resource(resource.uri) for resource in subscribed),
+                        return_exceptions=True
+                    )
+                    for resource, result in zip(subscribed, results):
+                        if isinstance(result, Exception):
+                            logger.error("  Error unsubscribing from %s: %s", resource.name, result)
+                        else:
+                            logger.info("  Unsubscribed from %s", resource.name)
                         
                 # Display resource templates if available
                 if resources.templates and len(resources.templates) > 0:
                     logger.info("Available templates:")
                     for template in resources.templates:
-                        logger.info(f"Template: {template.name}")
-                        logger.info(f"  URI Template: {template.uri_template}")
-                        logger.info(f"  Description: {template.description or 'No description'}")
-                        logger.info(f"  MIME Type: {template.mime_type or 'Not specified'}")
+                        logger.info("Template: %s", template.name)
+                        logger.info("  URI Template: %s", template.uri_template)
+                        logger.info("  Description: %s", template.description or 'No description')
+                        logger.info("  MIME Type: %s", template.mime_type or 'Not specified')
                         
                         # Try using the template if it's a known format
                         if "formula" in template.uri_template:
                             try:
                                 formula_uri = template.uri_template.replace("{formula}", "1+1")
-                                logger.info(f"  Using template with '1+1': {formula_uri}")
+                                logger.info("  Using template with '1+1': %s", formula_uri)
                                 formula_content = await mcp.read_resource(formula_uri)
                                 for item in formula_content.contents:
                                     if item.text:
-                                        logger.info(f"    Result: {item.text}")
+                                        logger.info("    Result: %s", item.text)
                             except Exception as e:
-                                logger.error(f"  Error using template: {e}")
+                                logger.error("  Error using template: %s", e)
                 else:
                     logger.info("No resource templates available from this server")
                 
             except Exception as e:
-                logger.error(f"Error working with resources: {e}")
+                logger.error("Error working with resources: %s", e)
     
     except MCPConnectionError as e:
-        logger.error(f"Connection error: {e}")
+        logger.error("Connection error: %s", e)
         logger.info("Make sure the math_server.py is running with 'python servers/math_server.py'")
     except MCPError as e:
-        logger.error(f"MCP Client error: {e}")
+        logger.error("MCP Client error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
 
 if __name__ == "__main__":
-    # Run the async example
-    asyncio.run(use_math_server()) 
\ No newline at end of file
+    # Run on uvloop when it's installed
+    run(use_math_server())
@@ -14,102 +14,120 @@ This example shows:
 import asyncio
 import logging
 import os
-import json
 from dotenv import load_dotenv
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage
+from langchain_core.prompts import ChatPromptTemplate
 from mcpwire import MCPClient, MCPError
+from mcpwire.utils import json_loads
+
+from _runtime import run, configure_logging
 
 # Load environment variables
 load_dotenv()
 
 # Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Cap on questions sent to the model at once
+MAX_LLM_CONCURRENCY = 4
+
+# Built once and reused for every question instead of constructing a new
+# HumanMessage per question
+PROMPT = ChatPromptTemplate.from_messages([("human", "{question}")])
+
+async def answer_question(mcp: MCPClient, question: str, response) -> None:
+    """Answer one question from the model's response, calling an MCP tool if it asks for one."""
+    if isinstance(response, Exception):
+        logger.error("[%s] Error processing question: %s", question, response)
+        return
+    try:
+        # Check if there is a function call in the response
+        if hasattr(response, 'additional_kwargs') and 'function_call' in response.additional_kwargs:
+            function_call = response.additional_kwargs['function_call']
+            tool_name = function_call['name']
+            # Parsed with orjson when it's installed (the "fast" extra)
+            tool_args = json_loads(function_call['arguments'])
+            logger.info("[%s] Calling tool: %s with args: %s", question, tool_name, tool_args)
+            
+            # Call the tool and get the result
+            result = await mcp.call_tool(tool_name, tool_args)
+            
+            # Extract the actual result from the response
+            if hasattr(result, 'content') and result.content:
+                tool_result = result.content[0].text if result.content[0].type == 'text' else str(result.content[0])
+            else:
+                tool_result = str(result)
+            
+            # Create a human-readable answer
+            if tool_name == 'multiply':
+                answer = f"The result of multiplying {tool_args['a']} and {tool_args['b']} is {tool_result}"
+            elif tool_name == 'add':
+                answer = f"The result of adding {tool_args['a']} and {tool_args['b']} is {tool_result}"
+            else:
+                answer = f"Tool {tool_name} result: {tool_result}"
+            
+            logger.info("[%s] Answer: %s", question, answer)
+        else:
+            logger.info("[%s] Answer: %s", question, response.content)
+            
+    except Exception as e:
+        logger.error("[%s] Error processing question: %s", question, e)
+
 async def main():
     """Main function to demonstrate using MCPWire tools with LangChain."""
     logger.info("\n=== LangChain with MCPWire Tools Example ===\n")
     
-    client = None
+    gemini_api_key = os.getenv("GEMINI_API_KEY")
+    if not gemini_api_key:
+        logger.error("GEMINI_API_KEY is not set. Add it to your environment or .env file.")
+        return
+    
+    # Imported only once the key is known to be present, so the missing-key
+    # path above doesn't pay for loading the Gemini integration
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    
     try:
-        # Load the client from config
-        client = MCPClient.from_config()
-        
-        # Get available tools from the MCP server
-        logger.info("Loading tools from MCP server...")
-        tools = await client.list_tools()
-        logger.info(f"Loaded {len(tools)} tools from the server")
-        
-        # Initialize the Gemini model
-        llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash-001",
-            google_api_key=os.getenv("GEMINI_API_KEY"),
-            temperature=0
-        )
-        
-        # Bind tools to the model
-        llm_with_tools = llm.bind_tools(tools)
-        
-        # Example questions to demonstrate the capabilities
-        questions = [
-            "List me all the available tools for me ?",
-            "Multiply 10 and 25",
-        ]
-        
-        # Process each question
-        for question in questions:
-            logger.info(f"\nQuestion: {question}")
-            try:
-                # Get the model's response
-                response = await llm_with_tools.ainvoke([HumanMessage(content=question)])
-                
-                # Check if there is a function call in the response
-                if hasattr(response, 'additional_kwargs') and 'function_call' in response.additional_kwargs:
-                    function_call = response.additional_kwargs['function_call']
-                    tool_name = function_call['name']
-                    tool_args = json.loads(function_call['arguments'])
-                    logger.info(f"Calling tool: {tool_name} with args: {tool_args}")
-                    
-                    # Call the tool and get the result
-                    result = await client.call_tool(tool_name, tool_args)
-                    
-                    # Extract the actual result from the response
-                    if hasattr(result, 'content') and result.content:
-                        tool_result = result.content[0].text if result.content[0].type == 'text' else str(result.content[0])
-                    else:
-                        tool_result = str(result)
-                    
-                    # Create a human-readable answer
-                    if tool_name == 'multiply':
-                        answer = f"The result of multiplying {tool_args['a']} and {tool_args['b']} is {tool_result}"
-                    elif tool_name == 'add':
-                        answer = f"The result of adding {tool_args['a']} and {tool_args['b']} is {tool_result}"
-                    else:
-                        answer = f"Tool {tool_name} result: {tool_result}"
-                    
-                    logger.info(f"Answer: {answer}")
-                else:
-                    logger.info(f"Answer: {response.content}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing question: {e}")
+        # Load the client from config and keep its session open for every question
+        async with MCPClient.from_config() as mcp:
+            # Get available tools from the MCP server
+            logger.info("Loading tools from MCP server...")
+            tools = await mcp.list_tools()
+            logger.info("Loaded %s tools from the server", len(tools))
+            
+            # Initialize the Gemini model
+            llm = ChatGoogleGenerativeAI(
+                model="gemini-2.0-flash-001",
+                google_api_key=gemini_api_key,
+                temperature=0
+            )
+            
+            # Bind tools to the model and put the prompt in front of it
+            chain = PROMPT | llm.bind_tools(tools)
+            
+            # Example questions to demonstrate the capabilities
+            questions = [
+                "List me all the available tools for me ?",
+                "Multiply 10 and 25",
+            ]
+            
+            for question in questions:
+                logger.info("\nQuestion: %s", question)
+            
+            # The questions are independent, so batch them through the model and
+            # then run any tool calls concurrently over the shared MCP session
+            responses = await chain.abatch(
+                [{"question": q} for q in questions],
+                config={"max_concurrency": MAX_LLM_CONCURRENCY},
+                return_exceptions=True
+            )
+            await asyncio.gather(*(answer_question(mcp, q, r) for q, r in zip(questions, responses)))
                 
     except MCPError as e:
-        logger.error(f"MCP Error: {e}")
+        logger.error("MCP Error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-    finally:
-        # Clean up the client
-        if client:
-            try:
-                await client.__aexit__(None, None, None)
-            except Exception as e:
-                logger.error(f"Error cleaning up client: {e}")
+        logger.error("Unexpected error: %s", e)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run on uvloop when it's installed
+    run(main())
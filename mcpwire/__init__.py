@@ -14,7 +14,8 @@ langchain-mcp-adapters.
 __version__ = "0.5.1" # Updated to include resource support
 
 # Import core classes and exceptions for easier access
-from .client import MCPClient, MultiServerMCPClient, StdioConnection, SSEConnection
+from .client import MCPClient, MultiServerMCPClient, StdioConnection, SSEConnection, mcp_session
+from .pool import ClientPool, get_client
 from .exceptions import (
     MCPError,
     MCPAPIError,
@@ -55,6 +56,11 @@ __all__ = [
     "MultiServerMCPClient",
     "StdioConnection",
     "SSEConnection",
+    "mcp_session",
+
+    # Connection Pooling
+    "ClientPool",
+    "get_client",
 
     # Exceptions
     "MCPError",
@@ -7,18 +7,23 @@ Uses the official MCP library and langchain-mcp-adapters.
 
 import os
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Union, Type, TypeVar, Mapping, Literal
+import importlib.util
+from typing import Dict, Any, Optional, List, Union, Type, TypeVar, Mapping, Literal, Tuple, Awaitable, Callable, AsyncIterator, FrozenSet
 from pathlib import Path
-from contextlib import AsyncExitStack
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 from types import TracebackType
 
+import httpx
 from pydantic import BaseModel
 
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.tools import BaseTool
 
 from mcp import ClientSession, StdioServerParameters
+from mcp import types as mcp_types
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 
@@ -28,6 +33,7 @@ from langchain_mcp_adapters.tools import load_mcp_tools
 from .exceptions import (
     MCPConnectionError, MCPAPIError, MCPTimeoutError, MCPDataError, MCPError
 )
+from .utils import json_loads
 from .models import ServerMetadata, ListResourcesResponse, Resource, ResourceTemplate, ReadResourceResponse, ResourceContent
 
 logger = logging.getLogger(__name__)
@@ -39,6 +45,95 @@ DEFAULT_ENCODING = "utf-8"
 DEFAULT_ENCODING_ERROR_HANDLER: Literal["strict", "ignore", "replace"] = "strict"
 DEFAULT_HTTP_TIMEOUT = 5
 DEFAULT_SSE_READ_TIMEOUT = 60 * 5
+DEFAULT_META_TTL = 30
+META_TTL_ENV_VAR = "MCP_RESOURCE_CACHE_TTL_SECONDS"
+HTTP2_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=32, keepalive_expiry=30)
+
+def _http2_client_factory(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None,
+) -> httpx.AsyncClient:
+    """
+    Build the httpx client for an SSE session with HTTP/2 enabled.
+
+    Concurrent POSTs then share one multiplexed connection instead of queueing
+    behind each other. HTTP/1.1 stays enabled, since HTTP/2 is negotiated via
+    TLS ALPN and plain ``http://`` servers only speak HTTP/1.1. Redirects are
+    followed, as with the MCP library's default client factory.
+    """
+    if timeout is None:
+        timeout = httpx.Timeout(DEFAULT_HTTP_TIMEOUT, read=DEFAULT_SSE_READ_TIMEOUT)
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        follow_redirects=True,
+        http2=True,
+        limits=HTTP2_LIMITS,
+    )
+
+def _require_param(method: str, params: Dict[str, Any], key: str) -> Any:
+    """Return a required JSON-RPC param, raising ValueError if it is missing."""
+    if key not in params:
+        raise ValueError(f"Missing '{key}' param for batch method '{method}'.")
+    return params[key]
+
+def _build_rpc_requests(calls, dispatch) -> List[Awaitable[Any]]:
+    """
+    Turn ``(method, params)`` pairs into coroutines using ``dispatch``.
+
+    All calls are validated before anything is sent; if one is invalid, the
+    coroutines already created are closed so none of the batch runs.
+    """
+    requests = []
+    try:
+        for method, params in calls:
+            requests.append(dispatch(method, params or {}))
+    except Exception:
+        for request in requests:
+            request.close()
+        raise
+    return requests
+
+def _capability_methods(capabilities: Any) -> FrozenSet[str]:
+    """
+    Expand the ServerCapabilities from an initialize result into the set of
+    request methods the server supports.
+    """
+    methods = set()
+    if capabilities is None:
+        return frozenset()
+    if getattr(capabilities, "tools", None) is not None:
+        methods.update(("tools/list", "tools/call"))
+    if getattr(capabilities, "prompts", None) is not None:
+        methods.update(("prompts/list", "prompts/get"))
+    resources = getattr(capabilities, "resources", None)
+    if resources is not None:
+        methods.update(("resources/list", "resources/read", "resources/templates/list"))
+        if getattr(resources, "subscribe", False):
+            methods.update(("resources/subscribe", "resources/unsubscribe"))
+    if getattr(capabilities, "logging", None) is not None:
+        methods.add("logging/setLevel")
+    if getattr(capabilities, "completions", None) is not None:
+        methods.add("completion/complete")
+    return frozenset(methods)
+
+def _is_json_mime_type(mime_type: Optional[str]) -> bool:
+    """Return True for application/json and structured-syntax ``+json`` types."""
+    if not mime_type:
+        return False
+    essence = mime_type.split(";", 1)[0].strip().lower()
+    return essence == "application/json" or essence.endswith("+json")
+
+def _to_resource(resource: Any) -> Resource:
+    """Convert a resource from the MCP library into our Resource model."""
+    return Resource(
+        uri=str(resource.uri),  # Convert URI to string to avoid validation issues
+        name=resource.name,
+        description=resource.description,
+        mime_type=getattr(resource, "mimeType", None) or getattr(resource, "mime_type", None)
+    )
 
 class StdioConnection(dict):
     """Configuration for stdio connection to MCP server."""
@@ -73,10 +168,16 @@ class SSEConnection(dict):
     """HTTP timeout"""
     sse_read_timeout: float = DEFAULT_SSE_READ_TIMEOUT
     """SSE read timeout"""
+    httpx_client_factory: Optional[Callable[..., Any]] = None
+    """
+    Factory for the httpx.AsyncClient that carries the SSE stream and POSTs.
+    Called with ``headers``, ``timeout`` and ``auth`` keyword arguments; use it
+    to configure connection limits or HTTP/2.
+    """
     session_kwargs: Optional[Dict[str, Any]] = None
     """Additional keyword arguments to pass to the ClientSession"""
 
-class MCPClient:
+class MCPClient(AbstractAsyncContextManager):
     """
     Client for interacting with a Model Context Protocol (MCP) server.
     Uses the official MCP library and langchain-mcp-adapters.
@@ -96,12 +197,22 @@ class MCPClient:
         transport: str = "http",
         command: Optional[str] = None,
         args: Optional[List[str]] = None,
+        meta_ttl: Optional[float] = None,
+        httpx_client_factory: Optional[Callable[..., Any]] = None,
+        http2: bool = False,
     ):
         self.transport = transport
         self.command = command
         self.args = args or []
         self.base_url = base_url.rstrip('/') if base_url else None
         self.timeout = timeout
+        self.meta_ttl = meta_ttl if meta_ttl is not None else self._default_meta_ttl()
+        self.httpx_client_factory = httpx_client_factory
+        if http2 and httpx_client_factory is None:
+            if importlib.util.find_spec("h2") is None:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed (pip install mcpwire[http2]); using HTTP/1.1.")
+            else:
+                self.httpx_client_factory = _http2_client_factory
         
         # Store default parameters
         self.default_parameters = {}
@@ -135,11 +246,35 @@ class MCPClient:
         # Initialize MCP client
         self._mcpwire = None
         self._exit_stack = None
+        # Request methods the server advertised at initialize time
+        self._capabilities: FrozenSet[str] = frozenset()
+
+        # Cache for read-mostly catalog calls (tools, resources, metadata),
+        # keyed by call and holding (expires_at, value) pairs
+        self._meta_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+        # In-flight catalog requests, shared by concurrent callers of the same call
+        self._inflight: Dict[Tuple[str, ...], "asyncio.Future[Any]"] = {}
+        # Bumped on invalidation so a fetch that was in flight at the time
+        # doesn't repopulate the cache with a stale result
+        self._meta_generations: Dict[Tuple[str, ...], int] = {}
+        self._meta_epoch = 0
         
         logger.info(f"MCPClient initialized (Transport: {self.transport})")
         if self.base_url:
             logger.info(f"Base URL: {self.base_url}")
         
+    @staticmethod
+    def _default_meta_ttl() -> float:
+        """Returns the catalog cache TTL from the environment, or the built-in default."""
+        value = os.getenv(META_TTL_ENV_VAR)
+        if value is None:
+            return DEFAULT_META_TTL
+        try:
+            return float(value)
+        except ValueError:
+            logger.warning(f"Invalid value '{value}' for {META_TTL_ENV_VAR}; using the default of {DEFAULT_META_TTL}s.")
+            return DEFAULT_META_TTL
+
     @classmethod
     def _find_config_file(cls, config_path: Optional[str] = None) -> Optional[Path]:
         """ Finds the MCP configuration file. """
@@ -167,6 +302,31 @@ class MCPClient:
         logger.debug(f"Configuration file '{DEFAULT_CONFIG_FILENAME}' not found in specified or standard locations.")
         return None
 
+    @staticmethod
+    def _load_config(config_path: Path) -> Dict[str, Any]:
+        """
+        Reads and parses a configuration file.
+
+        Args:
+            config_path: The configuration file to load.
+
+        Returns:
+            The parsed configuration.
+
+        Raises:
+            MCPDataError: If the file is not valid JSON.
+            OSError: If the file cannot be read.
+        """
+        try:
+            with open(config_path, 'rb') as f:
+                return json_loads(f.read())
+        except json.JSONDecodeError as e:
+            raise MCPDataError(f"Invalid JSON in configuration file '{config_path}': {e}") from e
+        except OSError as e:
+            raise OSError(f"Could not read configuration file '{config_path}': {e}") from e
+        except Exception as e:
+             raise MCPError(f"Unexpected error loading config file '{config_path}': {e}") from e
+
     @classmethod
     def from_config(
         cls,
@@ -196,16 +356,7 @@ class MCPClient:
             raise FileNotFoundError(f"MCP configuration file not found at '{config_path}' or in standard locations.")
 
         logger.info(f"Loading MCP configuration from: {found_config_path}")
-
-        try:
-            with open(found_config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise MCPDataError(f"Invalid JSON in configuration file '{found_config_path}': {e}") from e
-        except OSError as e:
-            raise OSError(f"Could not read configuration file '{found_config_path}': {e}") from e
-        except Exception as e:
-             raise MCPError(f"Unexpected error loading config file '{found_config_path}': {e}") from e
+        config_data = cls._load_config(found_config_path)
 
         # Determine target server name
         target_server_name = server_name
@@ -242,7 +393,7 @@ class MCPClient:
             if args is not None and not isinstance(args, list):
                 raise MCPDataError(f"Invalid 'args' format for stdio transport in server '{target_server_name}'. Expected a list.")
             base_url = None # Base URL is not relevant for stdio
-        elif transport in ["http", "sse"]:
+        elif transport in ["http", "sse", "websocket"]:
             if not base_url or not isinstance(base_url, str):
                 raise MCPDataError(f"Missing or invalid 'base_url' (string) for server '{target_server_name}' with transport '{transport}'.")
         else:
@@ -251,6 +402,8 @@ class MCPClient:
         # Extract values from config
         api_key_from_conf = server_config.get("api_key")
         timeout_from_conf = server_config.get("timeout")
+        meta_ttl_from_conf = server_config.get("meta_ttl")
+        http2_from_conf = server_config.get("http2")
         config_default_headers = server_config.get("default_headers")
         config_default_parameters = server_config.get("default_parameters")
 
@@ -274,6 +427,8 @@ class MCPClient:
             "transport": kwargs.get("transport", transport),
             "command": kwargs.get("command", command),
             "args": kwargs.get("args", args),
+            "meta_ttl": kwargs.get("meta_ttl", meta_ttl_from_conf),
+            "http2": kwargs.get("http2", http2_from_conf),
         }
 
         # Filter out None values for kwargs that shouldn't be passed if not provided
@@ -308,10 +463,13 @@ class MCPClient:
                 
                 stdio_transport = await self._exit_stack.enter_async_context(stdio_client(server_params))
                 read, write = stdio_transport
-                session = await self._exit_stack.enter_async_context(ClientSession(read, write))
+                session = await self._exit_stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._handle_message)
+                )
                 
                 # Initialize the session
-                await session.initialize()
+                result = await session.initialize()
+                self._capabilities = _capability_methods(result.capabilities)
                 self._mcpwire = session
                 
             elif self.transport == "sse":
@@ -319,26 +477,163 @@ class MCPClient:
                 if not self.base_url:
                     raise MCPConnectionError("Base URL is required for SSE transport")
                     
+                # Only pass the factory when one is set, so older MCP releases
+                # without the parameter keep working
+                sse_kwargs = {}
+                if self.httpx_client_factory is not None:
+                    sse_kwargs["httpx_client_factory"] = self.httpx_client_factory
                 sse_transport = await self._exit_stack.enter_async_context(
-                    sse_client(self.base_url, self.headers, DEFAULT_HTTP_TIMEOUT, DEFAULT_SSE_READ_TIMEOUT)
+                    sse_client(self.base_url, self.headers, DEFAULT_HTTP_TIMEOUT, DEFAULT_SSE_READ_TIMEOUT, **sse_kwargs)
                 )
                 read, write = sse_transport
-                session = await self._exit_stack.enter_async_context(ClientSession(read, write))
+                session = await self._exit_stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._handle_message)
+                )
                 
                 # Initialize the session
-                await session.initialize()
+                result = await session.initialize()
+                self._capabilities = _capability_methods(result.capabilities)
                 self._mcpwire = session
             
+            elif self.transport == "websocket":
+                # Create WebSocket connection (a single bidirectional stream)
+                if not self.base_url:
+                    raise MCPConnectionError("Base URL is required for WebSocket transport")
+                try:
+                    from mcp.client.websocket import websocket_client
+                except ImportError as e:
+                    raise MCPConnectionError(
+                        "WebSocket transport requires the 'websockets' package. "
+                        "Install it with: pip install 'mcpwire[websocket]'"
+                    ) from e
+                if self.headers:
+                    logger.warning("Headers (including the API key) are not sent over the WebSocket transport.")
+
+                ws_transport = await self._exit_stack.enter_async_context(websocket_client(self.base_url))
+                read, write = ws_transport
+                session = await self._exit_stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._handle_message)
+                )
+
+                # Initialize the session
+                result = await session.initialize()
+                self._capabilities = _capability_methods(result.capabilities)
+                self._mcpwire = session
+
             elif self.transport == "http":
                 raise ValueError("HTTP transport is not supported by the official MCP library. Use 'sse' instead.")
             
             else:
                 raise ValueError(f"Unsupported transport protocol: {self.transport}")
     
+    def supports(self, method: str) -> bool:
+        """
+        Check whether the connected server advertised support for a request method.
+
+        The capabilities are read once from the server's initialize response,
+        so this is a set lookup. It returns False until the client is connected.
+
+        Args:
+            method: A JSON-RPC method name, e.g. ``"resources/subscribe"``.
+
+        Returns:
+            True if the server's capabilities cover the method.
+        """
+        return method in self._capabilities
+
+    async def ping(self) -> float:
+        """
+        Send a ping to the server, connecting first if needed.
+
+        Useful for warming the connection (process start-up, TCP and TLS
+        handshakes) before latency-sensitive work.
+
+        Returns:
+            The round-trip time of the ping, in seconds.
+
+        Raises:
+            MCPAPIError: If the ping fails.
+        """
+        await self._initialize()
+        start = time.perf_counter()
+        try:
+            await self._mcpwire.send_ping()
+        except Exception as e:
+            logger.error(f"Error pinging server: {e}")
+            raise MCPAPIError(f"Failed to ping server: {e}") from e
+        return time.perf_counter() - start
+
+    async def _handle_message(self, message: Any) -> None:
+        """Drop cached catalogs when the server reports that they changed."""
+        notification = getattr(message, "root", None)
+        if isinstance(notification, mcp_types.ToolListChangedNotification):
+            self._invalidate_meta(("tools",))
+        elif isinstance(notification, mcp_types.ResourceListChangedNotification):
+            self._invalidate_meta(("resources",))
+
+    def _invalidate_meta(self, key: Optional[Tuple[str, ...]] = None) -> None:
+        """
+        Invalidate cached catalog results.
+
+        Args:
+            key: The cache key to drop, e.g. ``("tools",)``. If None, the whole
+                 cache is cleared.
+        """
+        if key is None:
+            self._meta_cache.clear()
+            self._inflight.clear()
+            self._meta_epoch += 1
+        else:
+            self._meta_cache.pop(key, None)
+            self._inflight.pop(key, None)
+            self._meta_generations[key] = self._meta_generations.get(key, 0) + 1
+        logger.debug(f"Invalidated metadata cache ({key or 'all'})")
+
+    def _meta_generation(self, key: Tuple[str, ...]) -> Tuple[int, int]:
+        """Return the current invalidation generation for ``key``."""
+        return (self._meta_epoch, self._meta_generations.get(key, 0))
+
+    async def _cached_meta(self, key: Tuple[str, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached catalog result, calling ``fetch`` if it is missing or expired.
+
+        Entries live for ``meta_ttl`` seconds; a ``meta_ttl`` of 0 disables caching.
+        Concurrent misses for the same key share a single in-flight request
+        (even with caching disabled), so N simultaneous callers cost one RPC.
+        """
+        if self.meta_ttl > 0:
+            entry = self._meta_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            generation = self._meta_generation(key)
+            task.add_done_callback(lambda t: self._finish_meta_fetch(key, t, generation))
+        # Shield the shared request so one caller being cancelled doesn't
+        # cancel it for the others
+        return await asyncio.shield(task)
+
+    def _finish_meta_fetch(self, key: Tuple[str, ...], task: "asyncio.Future[Any]", generation: Tuple[int, int]) -> None:
+        """
+        Clear the in-flight entry for ``key`` and cache its result if it succeeded.
+
+        The result is only cached if ``key`` hasn't been invalidated since the
+        fetch started, since it may predate the change that invalidated it.
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.meta_ttl > 0 and self._meta_generation(key) == generation:
+            self._meta_cache[key] = (time.monotonic() + self.meta_ttl, task.result())
+
     async def list_tools(self) -> List[BaseTool]:
-        """List all available tools."""
+        """List all available tools (cached for ``meta_ttl`` seconds)."""
         await self._initialize()
-        return await load_mcp_tools(self._mcpwire)
+        return await self._cached_meta(("tools",), lambda: load_mcp_tools(self._mcpwire))
         
     async def get_prompt(self, prompt_name: str, arguments: Optional[Dict[str, Any]] = None) -> List[Union[HumanMessage, AIMessage]]:
         """Get a prompt from the MCP server."""
@@ -349,10 +644,64 @@ class MCPClient:
         """Call an MCP tool."""
         await self._initialize()
         return await self._mcpwire.call_tool(tool_name, arguments)
-        
+
+    async def call_batch(
+        self,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Issue several MCP requests together and return their results in order.
+
+        The official MCP library does not send JSON-RPC batch arrays, so the
+        requests are written to the open session concurrently instead. The
+        session correlates responses by request id, which means the whole
+        batch completes in roughly one round-trip rather than one per call.
+
+        Args:
+            calls: A list of ``(method, params)`` pairs, for example
+                   ``[("tools/call", {"name": "add", "arguments": {"a": 1, "b": 2}})]``.
+                   Supported methods are ``tools/list``, ``tools/call``,
+                   ``prompts/get``, ``resources/list``, ``resources/read``,
+                   ``resources/subscribe`` and ``resources/unsubscribe``.
+            return_exceptions: If True, a failing call places its exception in
+                               the corresponding result slot instead of raising.
+
+        Returns:
+            A list with one result per call, in the same order as ``calls``.
+
+        Raises:
+            ValueError: If a method is unsupported or its params are incomplete.
+        """
+        await self._initialize()
+        requests = _build_rpc_requests(calls, self._dispatch_rpc)
+        return list(await asyncio.gather(*requests, return_exceptions=return_exceptions))
+
+    def _dispatch_rpc(self, method: str, params: Dict[str, Any]) -> Awaitable[Any]:
+        """Map a JSON-RPC method name onto the matching client coroutine."""
+        if method == "tools/list":
+            return self.list_tools()
+        elif method == "tools/call":
+            return self.call_tool(_require_param(method, params, "name"), params.get("arguments") or {})
+        elif method == "prompts/get":
+            return self.get_prompt(_require_param(method, params, "name"), params.get("arguments"))
+        elif method == "resources/list":
+            return self.list_resources()
+        elif method == "resources/read":
+            return self.read_resource(_require_param(method, params, "uri"))
+        elif method == "resources/subscribe":
+            return self.subscribe_to_resource(_require_param(method, params, "uri"))
+        elif method == "resources/unsubscribe":
+            return self.unsubscribe_from_resource(_require_param(method, params, "uri"))
+        raise ValueError(f"Unsupported batch method: {method}")
+
     async def get_server_metadata(self) -> ServerMetadata:
         """Get metadata from the MCP server."""
         await self._initialize()
+        return await self._cached_meta(("metadata",), self._fetch_server_metadata)
+
+    async def _fetch_server_metadata(self) -> ServerMetadata:
+        """Fetch server metadata, bypassing the cache."""
         # Convert MCP server metadata to our ServerMetadata format
         metadata = await self._mcpwire.get_server_info()
         # Note: This is a simplified version, full implementation would need to map
@@ -367,28 +716,30 @@ class MCPClient:
     async def list_resources(self) -> ListResourcesResponse:
         """
         List all available resources and resource templates from the MCP server.
-        
+
+        The result is cached for ``meta_ttl`` seconds, or until the server
+        sends a resources/list_changed notification.
+
         Returns:
             ListResourcesResponse: Object containing lists of resources and templates.
-            
+
         Raises:
             MCPConnectionError: If connection to the server fails.
             MCPAPIError: If the server returns an error response.
             MCPTimeoutError: If the request times out.
         """
         await self._initialize()
+        return await self._cached_meta(("resources",), self._fetch_resources)
+
+    async def _fetch_resources(self) -> ListResourcesResponse:
+        """Fetch the resource catalog, bypassing the cache."""
         try:
             response = await self._mcpwire.list_resources()
             
             # Convert to our response format
             return ListResourcesResponse(
                 resources=[
-                    Resource(
-                        uri=str(resource.uri),  # Convert URI to string to avoid validation issues
-                        name=resource.name,
-                        description=resource.description,
-                        mime_type=getattr(resource, "mimeType", None) or getattr(resource, "mime_type", None)
-                    ) for resource in response.resources or []
+                    _to_resource(resource) for resource in response.resources or []
                 ],
                 templates=[
                     ResourceTemplate(
@@ -403,12 +754,49 @@ class MCPClient:
             logger.error(f"Error listing resources: {e}")
             raise MCPAPIError(f"Failed to list resources: {e}") from e
     
-    async def read_resource(self, uri: str) -> ReadResourceResponse:
+    async def iter_resources(self) -> AsyncIterator[Resource]:
+        """
+        Iterate over the server's resources one page at a time.
+
+        Unlike list_resources, this follows the server's ``nextCursor`` and
+        yields each resource as its page arrives, so large catalogs are never
+        held in memory all at once. Pages are not cached.
+
+        Yields:
+            Resource: Each resource advertised by the server.
+
+        Raises:
+            MCPConnectionError: If connection to the server fails.
+            MCPAPIError: If the server returns an error response.
+            MCPTimeoutError: If the request times out.
+        """
+        await self._initialize()
+        cursor = None
+        while True:
+            try:
+                if cursor is None:
+                    response = await self._mcpwire.list_resources()
+                else:
+                    response = await self._mcpwire.list_resources(cursor)
+            except Exception as e:
+                logger.error(f"Error listing resources: {e}")
+                raise MCPAPIError(f"Failed to list resources: {e}") from e
+
+            for resource in response.resources or []:
+                yield _to_resource(resource)
+
+            cursor = getattr(response, "nextCursor", None)
+            if not cursor:
+                break
+
+    async def read_resource(self, uri: str, parse: bool = False) -> ReadResourceResponse:
         """
         Read the content of a resource by its URI.
         
         Args:
             uri: The URI of the resource to read.
+            parse: If True, text contents with a JSON MIME type (``application/json``
+                   or ``+json``) are decoded into ``ResourceContent.data``.
             
         Returns:
             ReadResourceResponse: Object containing the resource contents.
@@ -417,6 +805,7 @@ class MCPClient:
             MCPConnectionError: If connection to the server fails.
             MCPAPIError: If the server returns an error response.
             MCPTimeoutError: If the request times out.
+            MCPDataError: If ``parse`` is set and JSON content fails to decode.
         """
         await self._initialize()
         try:
@@ -433,17 +822,26 @@ class MCPClient:
                     blob=getattr(content, "blob", None)
                 ))
             
-            return ReadResourceResponse(contents=contents)
         except Exception as e:
             logger.error(f"Error reading resource {uri}: {e}")
             raise MCPAPIError(f"Failed to read resource {uri}: {e}") from e
+
+        if parse:
+            for content in contents:
+                if content.text is not None and _is_json_mime_type(content.mime_type):
+                    try:
+                        content.data = json_loads(content.text)
+                    except json.JSONDecodeError as e:
+                        raise MCPDataError(f"Invalid JSON in resource {content.uri}: {e}") from e
+
+        return ReadResourceResponse(contents=contents)
     
     async def subscribe_to_resource(self, uri: str) -> None:
         """
         Subscribe to updates for a resource.
         
-        Note: This is implemented as a no-op if the underlying MCP client 
-        does not support resource subscription.
+        Note: This is a no-op, with a warning, if the server did not
+        advertise resource subscriptions.
         
         Args:
             uri: The URI of the resource to subscribe to.
@@ -454,11 +852,11 @@ class MCPClient:
             MCPTimeoutError: If the request times out.
         """
         await self._initialize()
+        if not self.supports("resources/subscribe"):
+            logger.warning(f"Server does not support resource subscriptions; not subscribing to {uri}")
+            return
         try:
-            if hasattr(self._mcpwire, 'subscribe_to_resource'):
-                await self._mcpwire.subscribe_to_resource(uri)
-            else:
-                logger.warning(f"Resource subscription not supported by this MCP implementation")
+            await self._mcpwire.subscribe_resource(uri)
         except Exception as e:
             logger.error(f"Error subscribing to resource {uri}: {e}")
             raise MCPAPIError(f"Failed to subscribe to resource {uri}: {e}") from e
@@ -467,8 +865,8 @@ class MCPClient:
         """
         Unsubscribe from updates for a resource.
         
-        Note: This is implemented as a no-op if the underlying MCP client 
-        does not support resource subscription.
+        Note: This is a no-op, with a warning, if the server did not
+        advertise resource subscriptions.
         
         Args:
             uri: The URI of the resource to unsubscribe from.
@@ -479,21 +877,34 @@ class MCPClient:
             MCPTimeoutError: If the request times out.
         """
         await self._initialize()
+        if not self.supports("resources/unsubscribe"):
+            logger.warning(f"Server does not support resource subscriptions; not unsubscribing from {uri}")
+            return
         try:
-            if hasattr(self._mcpwire, 'unsubscribe_from_resource'):
-                await self._mcpwire.unsubscribe_from_resource(uri)
-            else:
-                logger.warning(f"Resource subscription not supported by this MCP implementation")
+            await self._mcpwire.unsubscribe_resource(uri)
         except Exception as e:
             logger.error(f"Error unsubscribing from resource {uri}: {e}")
             raise MCPAPIError(f"Failed to unsubscribe from resource {uri}: {e}") from e
         
+    async def aclose(self) -> None:
+        """
+        Close the session and its transport (SSE stream or stdio process).
+
+        Safe to call more than once and after a failed connection attempt,
+        which can leave a partially opened transport behind. Calling it in a
+        ``finally`` block releases the stream immediately rather than leaving
+        it for garbage collection.
+        """
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self._mcpwire = None
+        self._capabilities = frozenset()
+        self._invalidate_meta()
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
     async def close(self):
-        """Close the MCP client."""
-        if self._exit_stack:
-            await self._exit_stack.aclose()
-            self._exit_stack = None
-            self._mcpwire = None
+        """Close the MCP client. Equivalent to aclose()."""
+        await self.aclose()
             
     async def __aenter__(self):
         """Enable use of the client as an async context manager."""
@@ -507,7 +918,7 @@ class MCPClient:
         exc_tb: Optional[TracebackType]
     ):
         """Ensure the client is closed when exiting the context manager."""
-        await self.close()
+        await self.aclose()
         
     def __enter__(self):
         """
@@ -522,7 +933,24 @@ class MCPClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Backward compatibility for synchronous context manager usage."""
         pass
-        
+
+@asynccontextmanager
+async def mcp_session(**kwargs) -> AsyncIterator[MCPClient]:
+    """
+    Create an MCPClient, connect it, and close it when the block exits.
+
+    Shorthand for constructing a client and entering it in one step:
+    ``async with mcp_session(base_url=..., transport="sse") as mcp:``.
+
+    Args:
+        **kwargs: Keyword arguments passed directly to the MCPClient constructor.
+
+    Yields:
+        The connected MCPClient.
+    """
+    async with MCPClient(**kwargs) as client:
+        yield client
+
 class MultiServerMCPClient:
     """
     Client for connecting to multiple MCP servers and loading tools from them.
@@ -588,12 +1016,7 @@ class MultiServerMCPClient:
             # Convert to our response format
             return ListResourcesResponse(
                 resources=[
-                    Resource(
-                        uri=str(resource.uri),  # Convert URI to string to avoid validation issues
-                        name=resource.name,
-                        description=resource.description,
-                        mime_type=getattr(resource, "mimeType", None) or getattr(resource, "mime_type", None)
-                    ) for resource in response.resources or []
+                    _to_resource(resource) for resource in response.resources or []
                 ],
                 templates=[
                     ResourceTemplate(
@@ -663,7 +1086,7 @@ class MultiServerMCPClient:
             raise ValueError(f"Server '{server_name}' not found.")
         
         try:
-            await server.subscribe_to_resource(uri)
+            await server.subscribe_resource(uri)
             logger.debug(f"Subscribed to resource: {uri} on server {server_name}")
         except Exception as e:
             logger.error(f"Error subscribing to resource {uri} on server {server_name}: {e}")
@@ -686,14 +1109,69 @@ class MultiServerMCPClient:
             raise ValueError(f"Server '{server_name}' not found.")
         
         try:
-            await server.unsubscribe_from_resource(uri)
+            await server.unsubscribe_resource(uri)
             logger.debug(f"Unsubscribed from resource: {uri} on server {server_name}")
         except Exception as e:
             logger.error(f"Error unsubscribing from resource {uri} on server {server_name}: {e}")
             raise MCPAPIError(f"Failed to unsubscribe from resource {uri} on server {server_name}: {e}") from e
-        
+
+    async def batch(
+        self,
+        server_name: str,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Issue several requests to one server together and return the results in order.
+
+        Like MCPClient.call_batch, the requests are sent concurrently over the
+        server's session, so the batch takes roughly one round-trip. The server
+        may process them in any order, so only batch calls that don't depend
+        on each other.
+
+        Args:
+            server_name: The name of the server to send the requests to.
+            calls: A list of ``(method, params)`` pairs. Supported methods are
+                   ``prompts/get``, ``resources/list``, ``resources/read``,
+                   ``resources/subscribe`` and ``resources/unsubscribe``.
+            return_exceptions: If True, a failing call places its exception in
+                               the corresponding result slot instead of raising.
+
+        Returns:
+            A list with one result per call, in the same order as ``calls``.
+
+        Raises:
+            ValueError: If the server is not found, or a method is unsupported
+                        or its params are incomplete.
+        """
+        if not self.get_server(server_name):
+            raise ValueError(f"Server '{server_name}' not found.")
+
+        requests = _build_rpc_requests(
+            calls, lambda method, params: self._dispatch_rpc(server_name, method, params)
+        )
+        return list(await asyncio.gather(*requests, return_exceptions=return_exceptions))
+
+    def _dispatch_rpc(self, server_name: str, method: str, params: Dict[str, Any]) -> Awaitable[Any]:
+        """Map a JSON-RPC method name onto the matching per-server coroutine."""
+        if method == "prompts/get":
+            return self.get_prompt(server_name, _require_param(method, params, "name"), params.get("arguments"))
+        elif method == "resources/list":
+            return self.list_resources(server_name)
+        elif method == "resources/read":
+            return self.read_resource(server_name, _require_param(method, params, "uri"))
+        elif method == "resources/subscribe":
+            return self.subscribe_to_resource(server_name, _require_param(method, params, "uri"))
+        elif method == "resources/unsubscribe":
+            return self.unsubscribe_from_resource(server_name, _require_param(method, params, "uri"))
+        raise ValueError(f"Unsupported batch method: {method}")
+
     async def __aenter__(self):
         """Enter async context."""
+        # Servers are connected one after another on purpose: every transport
+        # context holds an anyio cancel scope that must be exited by the task
+        # that entered it, so the connects can't be spread over gather()'d
+        # tasks that share the adapter's exit stack.
         return await self._mcpwire.__aenter__()
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -56,6 +56,7 @@ class ResourceContent(BaseModel):
     mime_type: Optional[str] = Field(None, alias="mimeType", description="MIME type of the resource.")
     text: Optional[str] = Field(None, description="Text content for text resources.")
     blob: Optional[str] = Field(None, description="Base64 encoded content for binary resources.")
+    data: Optional[Any] = Field(None, description="Decoded JSON content, set when the resource is read with parse=True.")
     
     class Config:
         populate_by_name = True
@@ -0,0 +1,173 @@
+# mcpwire/mcpwire/pool.py
+
+"""
+Connection pool for reusing initialized MCPClient sessions.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Hashable, Mapping, Optional, Tuple
+
+from .client import MCPClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IDLE = 8
+
+PoolKey = Tuple[Optional[str], str, Optional[str], Tuple[Tuple[str, Hashable], ...]]
+
+def _freeze(value: Any) -> Hashable:
+    """Turn a constructor argument into a hashable value for the pool key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _pool_key(base_url: Optional[str], transport: str, api_key: Optional[str], kwargs: Dict[str, Any]) -> PoolKey:
+    """Build the pool key; clients are only shared when every constructor argument matches."""
+    return (base_url, transport, api_key, tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
+
+class _PooledClient:
+    """
+    An MCPClient whose connection is opened and closed by a dedicated task.
+
+    The transports used by the official MCP library hold anyio cancel scopes,
+    which must be exited by the same task that entered them. Owning the
+    connection in its own task lets any task borrow the client and lets the
+    pool close it from wherever eviction happens.
+    """
+    def __init__(self, client: MCPClient):
+        self.client = client
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the owning task is still holding the connection open."""
+        return self._task is not None and not self._task.done()
+
+    async def open(self) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        await ready
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            await self.client._initialize()
+        except BaseException as e:
+            await self.client.aclose()
+            if not ready.done():
+                ready.set_exception(e)
+            return
+        try:
+            # ready is already done if the caller of open() was cancelled while
+            # connecting; nobody will use the client, so just close it
+            if ready.done():
+                return
+            ready.set_result(None)
+            await self._closing.wait()
+        finally:
+            # Also runs when the event loop cancels this task on shutdown
+            await self.client.aclose()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await self._task
+
+class ClientPool:
+    """
+    Hands out initialized MCPClient instances and keeps them open for reuse.
+
+    Idle clients are keyed by ``base_url``, ``transport``, ``api_key`` and any
+    other constructor arguments, so only identically configured clients are
+    shared. At most ``max_idle`` clients are kept across all keys; when the
+    limit is exceeded the least recently returned client is closed.
+    """
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_idle = max_idle
+        self._idle: Deque[Tuple[PoolKey, _PooledClient]] = deque()
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        base_url: Optional[str],
+        transport: str = "sse",
+        api_key: Optional[str] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[MCPClient]:
+        """
+        Borrow an initialized client, opening a new connection only if needed.
+
+        Args:
+            base_url: The server URL.
+            transport: The transport protocol ("sse" or "stdio").
+            api_key: Optional API key, also part of the pool key.
+            **kwargs: Extra MCPClient constructor arguments (timeout,
+                      default_headers, meta_ttl, ...). They are part of the pool
+                      key, so a client is only reused for the same arguments.
+
+        Yields:
+            An initialized MCPClient. It goes back to the pool when the block
+            exits normally, and is closed if the block raises.
+        """
+        key = _pool_key(base_url, transport, api_key, kwargs)
+        pooled = self._take_idle(key)
+        if pooled is None:
+            pooled = _PooledClient(MCPClient(base_url=base_url, transport=transport, api_key=api_key, **kwargs))
+            await pooled.open()
+        else:
+            logger.debug(f"Reusing pooled MCP client for {base_url} ({transport})")
+        try:
+            yield pooled.client
+        except BaseException:
+            # The session may be in an unknown state, so don't hand it out again
+            await pooled.close()
+            raise
+        await self._release(key, pooled)
+
+    def _take_idle(self, key: PoolKey) -> Optional[_PooledClient]:
+        """Remove and return the most recently returned live client for key."""
+        for entry in reversed(self._idle):
+            if entry[0] == key and entry[1].alive:
+                self._idle.remove(entry)
+                return entry[1]
+        # Drop clients whose event loop has gone away
+        for entry in [e for e in self._idle if not e[1].alive]:
+            self._idle.remove(entry)
+        return None
+
+    async def _release(self, key: PoolKey, pooled: _PooledClient) -> None:
+        self._idle.append((key, pooled))
+        while len(self._idle) > self.max_idle:
+            _, evicted = self._idle.popleft()
+            logger.debug(f"Closing idle MCP client for {evicted.client.base_url}")
+            await evicted.close()
+
+    async def aclose(self) -> None:
+        """Close all idle clients."""
+        while self._idle:
+            _, pooled = self._idle.popleft()
+            await pooled.close()
+
+_default_pool = ClientPool()
+
+def get_client(
+    base_url: Optional[str],
+    transport: str = "sse",
+    api_key: Optional[str] = None,
+    **kwargs: Any
+):
+    """
+    Borrow a client from the process-wide pool.
+
+    Usage:
+        async with get_client("http://localhost:8000/sse", "sse") as mcp:
+            tools = await mcp.list_tools()
+
+    See ClientPool.acquire for the arguments.
+    """
+    return _default_pool.acquire(base_url, transport, api_key, **kwargs)
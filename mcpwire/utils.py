@@ -4,8 +4,15 @@
 Utility functions for the MCP client.
 """
 
+import json
+from typing import Any, Union
 from urllib.parse import urljoin
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 def join_url_path(base_url: str, path: str) -> str:
     """
     Safely joins a base URL and a relative path segment.
@@ -31,3 +38,20 @@ def join_url_path(base_url: str, path: str) -> str:
     # Use lstrip('/') on the path to ensure urljoin behaves predictably even if base has no path
     return urljoin(base_url, path.lstrip('/'))
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON document, using orjson when it is installed.
+
+    Args:
+        data: The JSON text, as str or UTF-8 bytes.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON. orjson's
+            error type subclasses it, so callers can catch either.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
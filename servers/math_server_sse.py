@@ -9,113 +9,98 @@ with SSE (Server-Sent Events) transport and resource support.
 Run this server with:
     python servers/math_server_sse.py
 """
-import json
 import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 from mcp.server import FastMCP
-from mcp import Resource
 
 # Create an MCP server with a name
 mcp = FastMCP("MathSSE")
 
-# Track calculation history and current result
-calculation_history = []
-current_result = None
+@dataclass(slots=True)
+class CalcState:
+    """Calculation history and current result"""
+    history: list[str] = field(default_factory=list)
+    current: int | None = None
+    # The joined history, built on the first read after it changes
+    history_text: str | None = None
+
+    def record(self, entry: str, result: int) -> None:
+        """Append an entry to the history and make its result current"""
+        self.history.append(entry)
+        self.history_text = None
+        self.current = result
+
+# Shared by every client session. Tool handlers run on the server's event
+# loop, so updates never interleave
+state = CalcState()
 
 @mcp.tool()
 def add(a: int, b: int) -> int:
     """Add two numbers"""
     result = a + b
-    calculation_history.append(f"{a} + {b} = {result}")
-    global current_result
-    current_result = result
-    
-    # Update resources after calculation
-    mcp.add_resource(Resource(
-        uri="calc://current",
-        name="Current Calculation",
-        description="The result of the most recent calculation",
-        text=str(current_result),
-        mimeType="text/plain"
-    ))
-    
-    mcp.add_resource(Resource(
-        uri="calc://history",
-        name="Calculation History",
-        description="History of all calculations performed",
-        text="\n".join(calculation_history),
-        mimeType="text/plain"
-    ))
-    
+    # calc://current and calc://history are computed by their resource
+    # handlers when read, so there's nothing to rebuild here
+    state.record(f"{a} + {b} = {result}", result)
     return result
 
 @mcp.tool()
 def multiply(a: int, b: int) -> int:
     """Multiply two numbers"""
     result = a * b
-    calculation_history.append(f"{a} * {b} = {result}")
-    global current_result
-    current_result = result
-    
-    # Update resources after calculation
-    mcp.add_resource(Resource(
-        uri="calc://current",
-        name="Current Calculation",
-        description="The result of the most recent calculation",
-        text=str(current_result),
-        mimeType="text/plain"
-    ))
-    
-    mcp.add_resource(Resource(
-        uri="calc://history",
-        name="Calculation History",
-        description="History of all calculations performed",
-        text="\n".join(calculation_history),
-        mimeType="text/plain"
-    ))
-    
+    state.record(f"{a} * {b} = {result}", result)
     return result
 
+# Operations the batch tool can run, by name
+OPERATIONS = {"add": add, "multiply": multiply}
+
+@mcp.tool()
+def batch(ops: list[dict]) -> list[int]:
+    """Run several calculations in one call. Each op is {"op": "add" or "multiply", "a": int, "b": int}"""
+    # Validate every op before running any, so a bad op can't leave the
+    # earlier ones half-applied in the history
+    calls = []
+    for index, op in enumerate(ops):
+        operation = OPERATIONS.get(op.get("op"))
+        if operation is None:
+            raise ValueError(f"Unknown operation {op.get('op')!r} at index {index}; expected one of {sorted(OPERATIONS)}")
+        if not all(isinstance(op.get(arg), int) for arg in ("a", "b")):
+            raise ValueError(f"Operation at index {index} needs integer 'a' and 'b' arguments")
+        calls.append((operation, op["a"], op["b"]))
+    return [operation(a, b) for operation, a, b in calls]
+
 # Register resource handlers directly using the function decorator approach
-@mcp.resource("calc://history")
+@mcp.resource("calc://history", name="Calculation History", description="History of all calculations performed")
 def get_history():
     """Resource handler for calculation history"""
-    return "\n".join(calculation_history) if calculation_history else "No calculations yet"
+    if not state.history:
+        return "No calculations yet"
+    if state.history_text is None:
+        state.history_text = "\n".join(state.history)
+    return state.history_text
 
-@mcp.resource("calc://current")
+@mcp.resource("calc://current", name="Current Calculation", description="The result of the most recent calculation")
 def get_current_result():
     """Resource handler for current result"""
-    return str(current_result) if current_result is not None else "No result yet"
+    return str(state.current) if state.current is not None else "No result yet"
+
+# JSON document for a timestamp resource. Every field is an integer, so %d
+# formatting always yields valid JSON without going through json.dumps
+TIMESTAMP_TEMPLATE = '{"timestamp": %d, "server_time": %d, "message": "Server received request for timestamp %d"}'
 
-@mcp.resource("calc://timestamp/{time}")
+@lru_cache(maxsize=4096)
+def _timestamp_payload(timestamp: int) -> str:
+    """Build the JSON document for a timestamp; it depends only on the timestamp"""
+    return TIMESTAMP_TEMPLATE % (timestamp, timestamp, timestamp)
+
+@mcp.resource("calc://timestamp/{time}", mime_type="application/json")
 def get_timestamp_data(time):
     """Resource handler for timestamp data"""
     try:
-        timestamp = int(time)
-        return json.dumps({
-            "timestamp": timestamp,
-            "server_time": int(time),
-            "message": f"Server received request for timestamp {timestamp}"
-        })
+        return _timestamp_payload(int(time))
     except (ValueError, TypeError):
         return None
 
-# Initialize resources
-mcp.add_resource(Resource(
-    uri="calc://current",
-    name="Current Calculation",
-    description="The result of the most recent calculation",
-    text="No result yet",
-    mimeType="text/plain"
-))
-
-mcp.add_resource(Resource(
-    uri="calc://history",
-    name="Calculation History",
-    description="History of all calculations performed",
-    text="No calculations yet",
-    mimeType="text/plain"
-))
-
 
 if __name__ == "__main__":
     print("Starting Math SSE server with resource support on http://localhost:8000")
@@ -14,36 +14,49 @@ from mcp.server import FastMCP
 # Create an MCP server with a name
 mcp = FastMCP("MathStdio")
 
-# Track calculation history
-calculation_history = []
+# Track calculation history as newline-terminated UTF-8 in one buffer, rather
+# than one str object per entry
+calculation_history = bytearray()
+# The decoded history, built on the first read after it changes
+_history_text = None
+
+def _record(entry: str) -> None:
+    """Append an entry to the calculation history."""
+    global _history_text
+    calculation_history.extend(entry.encode())
+    calculation_history.extend(b"\n")
+    _history_text = None
 
 @mcp.tool()
 def hello(name: str) -> str:
     """Say hello to someone"""
     result = f"Hello, {name}!"
-    calculation_history.append(f"Greeted {name}")
+    _record(f"Greeted {name}")
     return result
 
 @mcp.tool()
 def add(a: int, b: int) -> int:
     """Add two numbers"""
     result = a + b
-    calculation_history.append(f"{a} + {b} = {result}")
+    _record(f"{a} + {b} = {result}")
     return result
 
 @mcp.tool()
 def multiply(a: int, b: int) -> int:
     """Multiply two numbers"""
     result = a * b
-    calculation_history.append(f"{a} * {b} = {result}")
+    _record(f"{a} * {b} = {result}")
     return result
 
 @mcp.tool()
 def get_history() -> str:
     """Get the history of calculations"""
+    global _history_text
     if not calculation_history:
         return "No calculations performed yet."
-    return "\n".join(calculation_history)
+    if _history_text is None:
+        _history_text = calculation_history[:-1].decode()
+    return _history_text
 
 # The default transport is 'stdio', so you could omit the parameter
 if __name__ == "__main__":
@@ -12,7 +12,9 @@ import json
 import os
 import asyncio
 import warnings
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, mock_open, AsyncMock, MagicMock
 
 import pytest_asyncio
@@ -31,8 +33,11 @@ from mcpwire import (
     ResourceTemplate,
     ResourceContent,
     ListResourcesResponse,
-    ReadResourceResponse
+    ReadResourceResponse,
+    mcp_session
 )
+from mcp import ClientSession
+from mcpwire import client as mcpwire_client
 from langchain_core.messages import HumanMessage, AIMessage
 
 # --- Test Fixtures ---
@@ -41,20 +46,44 @@ MOCK_SERVER_URL = "http://mock-mcp-server.test/v1"
 MOCK_API_KEY = "test-api-key"
 DEFAULT_TIMEOUT_VAL = 60
 
+# Read-only results for the mocked langchain-mcp-adapters loaders, shared by
+# the tests instead of being rebuilt in each one
+MOCK_TOOLS = [MagicMock(name="tool")]
+MOCK_PROMPT_MESSAGES = [HumanMessage(content="Hello"), AIMessage(content="Hi")]
+
+# ClientSession methods used by MCPClient
+SESSION_METHODS = (
+    "call_tool",
+    "list_resources",
+    "read_resource",
+    "send_ping",
+    "subscribe_resource",
+    "unsubscribe_resource",
+)
+
+# Request methods the mocked session's server advertises
+MOCK_CAPABILITIES = frozenset((
+    "tools/list", "tools/call",
+    "resources/list", "resources/read", "resources/subscribe", "resources/unsubscribe",
+))
+
 @pytest_asyncio.fixture
 async def mock_client():
     """Provides a mocked MCPClient instance with patched _initialize method."""
     client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", api_key=MOCK_API_KEY, timeout=5)
-    # Create a mock for the _mcpwire attribute
-    client._mcpwire = AsyncMock()
+    # Stub only the session methods MCPClient calls, rather than a full
+    # AsyncMock tree; a call to anything else fails loudly
+    client._mcpwire = SimpleNamespace(**{name: AsyncMock() for name in SESSION_METHODS})
+    client._capabilities = MOCK_CAPABILITIES
     client._exit_stack = AsyncMock()
     client._initialized = True
     
     # Set up a context manager for the client
     yield client
     
-    # Clean up the client after the test
-    if hasattr(client, "_exit_stack") and client._exit_stack:
+    # Clean up the client after the test; the fixture's own mocked exit
+    # stack has nothing to close
+    if client._exit_stack and not isinstance(client._exit_stack, AsyncMock):
         await client._exit_stack.aclose()
 
 @pytest_asyncio.fixture
@@ -69,7 +98,7 @@ async def mock_multi_client():
     
     yield multi_client
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config_dict() -> dict:
     """Provides a sample configuration dictionary."""
     return {
@@ -105,6 +134,10 @@ def sample_config_dict() -> dict:
                 "api_key": "env:MCP_TEST_API_KEY",
                 "timeout": 90
             },
+            "ws_server": {
+                "base_url": "ws://localhost:8000/ws",
+                "transport": "websocket"
+            },
             "stdio_server": {
                 "transport": "stdio",
                 "command": "python",
@@ -114,14 +147,21 @@ def sample_config_dict() -> dict:
         }
     }
 
-@pytest.fixture
-def mock_config_file(tmp_path: Path, sample_config_dict: dict) -> Path:
-    """Creates a temporary config file for testing from_config."""
-    config_file = tmp_path / "test_mcp.json"
-    with open(config_file, 'w') as f:
-        json.dump(sample_config_dict, f)
+@pytest.fixture(scope="session")
+def mock_config_file(tmp_path_factory: pytest.TempPathFactory, sample_config_dict: dict) -> Path:
+    """Creates a temporary config file for testing from_config. Tests only read it, so it is written once per session."""
+    config_file = tmp_path_factory.mktemp("config") / "test_mcp.json"
+    # Encode in one go and write once; json.dump writes chunk by chunk
+    config_file.write_text(json.dumps(sample_config_dict))
     return config_file
 
+@pytest.fixture
+def mock_config(monkeypatch, sample_config_dict: dict) -> str:
+    """Serves sample_config_dict to from_config without touching the filesystem. Returns the config path to pass."""
+    monkeypatch.setattr(MCPClient, "_find_config_file", classmethod(lambda cls, config_path=None: Path(config_path)))
+    monkeypatch.setattr(MCPClient, "_load_config", staticmethod(lambda config_path: sample_config_dict))
+    return "mcp.json"
+
 @pytest.fixture
 def mock_resources():
     """Provides sample resources for testing."""
@@ -150,32 +190,55 @@ def mock_resource_contents():
 
 # == Basic Client Tests ==
 
-def test_client_initialization():
-    """Test that the client initializes with the correct parameters."""
-    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", api_key=MOCK_API_KEY, timeout=5)
-    assert client.base_url == MOCK_SERVER_URL
-    assert client.transport == "sse"
-    assert client.timeout == 5
-    assert "Authorization" in client.headers
-    assert client.headers["Authorization"] == f"Bearer {MOCK_API_KEY}"
-
-def test_client_initialization_no_api_key():
-    """Test client initialization without an API key."""
-    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
-    assert "Authorization" not in client.headers
-
-def test_client_initialization_env_api_key_found(monkeypatch):
-    """Test that env var api_key is resolved correctly."""
-    api_key_value = "key-from-environment"
-    monkeypatch.setenv("MCP_TEST_KEY", api_key_value)
+def test_session_stubs_match_client_session():
+    """Test that mock_client only stubs methods the real ClientSession has."""
+    missing = [name for name in SESSION_METHODS if not hasattr(ClientSession, name)]
+    assert not missing
+
+class TestDirectInit:
+    """Tests for clients constructed directly. The clients are built once for the class, since the tests only read them."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", api_key=MOCK_API_KEY, timeout=5)
+        cls.client_no_key = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
+
+    def test_client_initialization(self):
+        """Test that the client initializes with the correct parameters."""
+        assert self.client.base_url == MOCK_SERVER_URL
+        assert self.client.transport == "sse"
+        assert self.client.timeout == 5
+        assert "Authorization" in self.client.headers
+        assert self.client.headers["Authorization"] == f"Bearer {MOCK_API_KEY}"
+
+    def test_client_initialization_no_api_key(self):
+        """Test client initialization without an API key."""
+        assert "Authorization" not in self.client_no_key.headers
+
+@pytest.mark.parametrize("env_value, expected_auth", [
+    ("key-from-environment", "Bearer key-from-environment"),
+    (None, None),
+], ids=["found", "not_found"])
+def test_client_initialization_env_api_key(monkeypatch, env_value, expected_auth):
+    """Test that an env var api_key is resolved, and omitted when the variable is unset."""
+    if env_value is None:
+        monkeypatch.delenv("MCP_TEST_KEY", raising=False)
+    else:
+        monkeypatch.setenv("MCP_TEST_KEY", env_value)
     client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", api_key="env:MCP_TEST_KEY")
-    assert client.headers["Authorization"] == f"Bearer {api_key_value}"
+    assert client.headers.get("Authorization") == expected_auth
+
+def test_client_meta_ttl_from_env(monkeypatch):
+    """Test that the catalog cache TTL can be set through the environment."""
+    monkeypatch.setenv("MCP_RESOURCE_CACHE_TTL_SECONDS", "120")
+    assert MCPClient(base_url=MOCK_SERVER_URL, transport="sse").meta_ttl == 120
+    # An explicit argument still wins over the environment
+    assert MCPClient(base_url=MOCK_SERVER_URL, transport="sse", meta_ttl=0).meta_ttl == 0
 
-def test_client_initialization_env_api_key_not_found(monkeypatch):
-    """Test behavior when env var for api_key is not found."""
-    monkeypatch.delenv("MCP_MISSING_KEY", raising=False)
-    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", api_key="env:MCP_MISSING_KEY")
-    assert "Authorization" not in client.headers
+def test_client_meta_ttl_invalid_env(monkeypatch):
+    """Test that an unparseable TTL in the environment falls back to the default."""
+    monkeypatch.setenv("MCP_RESOURCE_CACHE_TTL_SECONDS", "soon")
+    assert MCPClient(base_url=MOCK_SERVER_URL, transport="sse").meta_ttl == 30
 
 # Update this test based on your implementation - either skip or modify based on how 
 # MCPClient handles HTTP transport
@@ -186,33 +249,30 @@ def test_client_initialization_http_transport(mock_init):
 
 # == from_config Tests ==
 
-def test_from_config_loads_specific_server(mock_config_file: Path):
-    """Test loading a specific server from configuration."""
-    client = MCPClient.from_config(server_name="remote", config_path=str(mock_config_file))
-    assert client.base_url == "https://remote-mcp.test"
-    assert client.transport == "sse"
-    assert client.timeout == DEFAULT_TIMEOUT_VAL
-
-def test_from_config_loads_default_server(mock_config_file: Path):
-    """Test loading the default server from configuration."""
-    client = MCPClient.from_config(config_path=str(mock_config_file))
-    assert client.base_url == "http://localhost:8000"
-    assert client.transport == "sse"
-    assert client.timeout == 30
-
-def test_from_config_loads_stdio_server(mock_config_file: Path):
-    """Test loading a stdio server from configuration."""
-    client = MCPClient.from_config(server_name="stdio_server", config_path=str(mock_config_file))
-    assert client.transport == "stdio"
-    assert client.command == "python"
-    assert client.args == ["-m", "mcp.server.cli"]
-    assert client.timeout == 60
-
-def test_from_config_loads_env_key(mock_config_file: Path, monkeypatch):
+@pytest.mark.parametrize("server_name, expected", [
+    ("remote", {"base_url": "https://remote-mcp.test", "transport": "sse", "timeout": DEFAULT_TIMEOUT_VAL}),
+    (None, {"base_url": "http://localhost:8000", "transport": "sse", "timeout": 30}),
+    ("stdio_server", {"transport": "stdio", "command": "python", "args": ["-m", "mcp.server.cli"], "timeout": 60}),
+    ("ws_server", {"transport": "websocket", "base_url": "ws://localhost:8000/ws"}),
+], ids=["specific", "default", "stdio", "websocket"])
+def test_from_config_loads_server(mock_config: str, server_name, expected):
+    """Test loading a named server, or the default one, from configuration."""
+    client = MCPClient.from_config(server_name=server_name, config_path=mock_config)
+    for attr, value in expected.items():
+        assert getattr(client, attr) == value
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_load_config_reads_file(mock_config_file: Path, sample_config_dict: dict, monkeypatch, use_orjson):
+    """Test that the config file is parsed, with or without orjson installed."""
+    if not use_orjson:
+        monkeypatch.setattr("mcpwire.utils.orjson", None)
+    assert MCPClient._load_config(mock_config_file) == sample_config_dict
+
+def test_from_config_loads_env_key(mock_config: str, monkeypatch):
     """Test loading a server with an env var API key."""
     api_key_value = "actual-env-key-456"
     monkeypatch.setenv("MCP_TEST_API_KEY", api_key_value)
-    client = MCPClient.from_config(server_name="env_key_server", config_path=str(mock_config_file))
+    client = MCPClient.from_config(server_name="env_key_server", config_path=mock_config)
     assert client.headers["Authorization"] == f"Bearer {api_key_value}"
 
 def test_from_config_file_not_found():
@@ -220,52 +280,61 @@ def test_from_config_file_not_found():
     with pytest.raises(FileNotFoundError):
         MCPClient.from_config(config_path="non_existent_file.json")
 
-def test_from_config_invalid_json(tmp_path: Path):
-    """Test error with invalid JSON in config file."""
-    invalid_json_path = tmp_path / "invalid.json"
-    with open(invalid_json_path, 'w') as f:
-        f.write("{invalid json")
-    with pytest.raises(MCPDataError, match="Invalid JSON"):
-        MCPClient.from_config(config_path=str(invalid_json_path))
-
-@patch("mcpwire.client.Path.home")
-@patch("mcpwire.client.Path.cwd")
-def test_find_config_file_search_order(mock_cwd, mock_home, tmp_path: Path):
-    """Test the search order for the config file."""
-    # Setup mock paths
+@pytest.mark.parametrize("contents, server_name, exc, message", [
+    ("{invalid json", None, MCPDataError, "Invalid JSON"),
+    ('{"default_server": "local"}', None, MCPDataError, "Missing or invalid 'servers'"),
+    ('{"servers": {"bad": {"transport": "sse"}}}', "bad", MCPDataError, "Missing or invalid 'base_url'"),
+    ('{"servers": {"bad": {"transport": "stdio"}}}', "bad", MCPDataError, "Missing 'command'"),
+    ('{"servers": {"bad": {"transport": "carrier-pigeon"}}}', "bad", ValueError, "Unsupported transport"),
+    ('{"servers": {}}', "missing", KeyError, "not found"),
+    ('{"servers": {"local": {}}}', None, ValueError, "No server_name specified"),
+], ids=["invalid_json", "missing_servers", "missing_base_url", "missing_command", "unsupported_transport", "unknown_server", "no_default"])
+def test_from_config_errors(tmp_path: Path, contents, server_name, exc, message):
+    """Test the errors raised for invalid configuration files."""
+    config_path = tmp_path / "invalid.json"
+    config_path.write_text(contents)
+    with pytest.raises(exc) as exc_info:
+        MCPClient.from_config(server_name=server_name, config_path=str(config_path))
+    assert message in str(exc_info.value)
+
+@pytest.fixture
+def config_search_tree(monkeypatch, tmp_path: Path) -> dict:
+    """Creates a config file in every standard search location, in precedence order."""
     cwd_path = tmp_path / "cwd"
     home_path = tmp_path / "home"
     config_home_path = home_path / ".config" / "mcp"
     cwd_path.mkdir()
-    home_path.mkdir()
     config_home_path.mkdir(parents=True)
 
-    mock_cwd.return_value = cwd_path
-    mock_home.return_value = home_path
-
-    # Create files in different locations
-    cwd_file = cwd_path / "mcp.json"; cwd_file.touch()
-    home_dot_file = home_path / ".mcp.json"; home_dot_file.touch()
-    xdg_config_file = config_home_path / "mcp.json"; xdg_config_file.touch()
+    monkeypatch.chdir(cwd_path)
+    # Path.home() reads HOME on POSIX and USERPROFILE on Windows
+    monkeypatch.setenv("HOME", str(home_path))
+    monkeypatch.setenv("USERPROFILE", str(home_path))
 
-    # 1. Explicit path
-    explicit_path = tmp_path / "explicit.json"; explicit_path.touch()
+    tree = {
+        "cwd": cwd_path / "mcp.json",
+        "home_dot": home_path / ".mcp.json",
+        "xdg": config_home_path / "mcp.json",
+    }
+    for path in tree.values():
+        path.touch()
+    return tree
+
+def test_find_config_file_explicit_path(config_search_tree: dict, tmp_path: Path):
+    """Test that an explicit path wins over the standard locations."""
+    explicit_path = tmp_path / "explicit.json"
+    explicit_path.touch()
     assert MCPClient._find_config_file(config_path=str(explicit_path)) == explicit_path.resolve()
 
-    # 2. CWD
-    assert MCPClient._find_config_file() == cwd_file # Should find in CWD first
-    cwd_file.unlink() # Remove CWD file
-
-    # 3. Home dot file
-    assert MCPClient._find_config_file() == home_dot_file
-    home_dot_file.unlink() # Remove home dot file
-
-    # 4. XDG config file
-    assert MCPClient._find_config_file() == xdg_config_file
-    xdg_config_file.unlink() # Remove XDG file
-
-    # 5. Not found
-    assert MCPClient._find_config_file() is None
+@pytest.mark.parametrize("rung", ["cwd", "home_dot", "xdg", None])
+def test_find_config_file_search_order(config_search_tree: dict, rung):
+    """Test that each location is used once every higher-precedence file is gone."""
+    for location, path in config_search_tree.items():
+        if location == rung:
+            break
+        path.unlink()
+    expected = config_search_tree[rung] if rung else None
+    assert MCPClient._find_config_file() == expected
 
 # == Async Client Method Tests ==
 
@@ -322,7 +391,7 @@ async def test_get_server_metadata(mock_client):
     server_info.name = "Test Server"
     server_info.version = "1.0.0"
     server_info.description = "A test server"
-    mock_client._mcpwire.get_server_info.return_value = server_info
+    mock_client._mcpwire.get_server_info = AsyncMock(return_value=server_info)
     
     # Call the method
     result = await mock_client.get_server_metadata()
@@ -341,8 +410,7 @@ async def test_get_server_metadata(mock_client):
 async def test_list_tools(mock_client, monkeypatch):
     """Test listing tools from the server."""
     # Setup mock for load_mcp_tools
-    mock_tools = [MagicMock()]
-    mock_load_tools = AsyncMock(return_value=mock_tools)
+    mock_load_tools = AsyncMock(return_value=MOCK_TOOLS)
     monkeypatch.setattr("mcpwire.client.load_mcp_tools", mock_load_tools)
     
     # Call the method
@@ -350,14 +418,98 @@ async def test_list_tools(mock_client, monkeypatch):
     
     # Check the result
     mock_load_tools.assert_called_once_with(mock_client._mcpwire)
-    assert result == mock_tools
+    assert result == MOCK_TOOLS
+
+@pytest.mark.asyncio
+async def test_list_tools_is_cached(mock_client, monkeypatch):
+    """Test that repeated list_tools calls within the TTL hit the cache."""
+    mock_load_tools = AsyncMock(return_value=MOCK_TOOLS)
+    monkeypatch.setattr("mcpwire.client.load_mcp_tools", mock_load_tools)
+
+    first = await mock_client.list_tools()
+    second = await mock_client.list_tools()
+
+    assert first is second
+    mock_load_tools.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_list_tools_cache_disabled(mock_client, monkeypatch):
+    """Test that a meta_ttl of 0 disables caching."""
+    mock_load_tools = AsyncMock(return_value=MOCK_TOOLS)
+    monkeypatch.setattr("mcpwire.client.load_mcp_tools", mock_load_tools)
+    mock_client.meta_ttl = 0
+
+    await mock_client.list_tools()
+    await mock_client.list_tools()
+
+    assert mock_load_tools.call_count == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_list_tools_share_one_request(mock_client, monkeypatch):
+    """Test that concurrent list_tools calls are coalesced into one request."""
+    async def slow_load_tools(session):
+        await asyncio.sleep(0.01)
+        return MOCK_TOOLS
+
+    mock_load_tools = AsyncMock(side_effect=slow_load_tools)
+    monkeypatch.setattr("mcpwire.client.load_mcp_tools", mock_load_tools)
+    mock_client.meta_ttl = 0
+
+    results = await asyncio.gather(*(mock_client.list_tools() for _ in range(5)))
+
+    mock_load_tools.assert_called_once()
+    assert all(result is results[0] for result in results)
+    assert not mock_client._inflight
+
+@pytest.mark.asyncio
+async def test_list_changed_notification_invalidates_cache(mock_client, monkeypatch):
+    """Test that a tools/list_changed notification drops the cached tools."""
+    from mcp import types as mcp_types
+
+    mock_load_tools = AsyncMock(return_value=MOCK_TOOLS)
+    monkeypatch.setattr("mcpwire.client.load_mcp_tools", mock_load_tools)
+
+    await mock_client.list_tools()
+    await mock_client._handle_message(
+        mcp_types.ServerNotification(mcp_types.ToolListChangedNotification(method="notifications/tools/list_changed"))
+    )
+    await mock_client.list_tools()
+
+    assert mock_load_tools.call_count == 2
+
+@pytest.mark.asyncio
+async def test_invalidation_during_fetch_is_not_cached(mock_client, monkeypatch):
+    """Test that a fetch invalidated while in flight doesn't repopulate the cache."""
+    from mcp import types as mcp_types
+
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def slow_load_tools(session):
+        started.set()
+        await finish.wait()
+        return MOCK_TOOLS
+
+    mock_load_tools = AsyncMock(side_effect=slow_load_tools)
+    monkeypatch.setattr("mcpwire.client.load_mcp_tools", mock_load_tools)
+
+    pending = asyncio.create_task(mock_client.list_tools())
+    await started.wait()
+    await mock_client._handle_message(
+        mcp_types.ServerNotification(mcp_types.ToolListChangedNotification(method="notifications/tools/list_changed"))
+    )
+    finish.set()
+    assert await pending == MOCK_TOOLS
+
+    assert ("tools",) not in mock_client._meta_cache
+    await mock_client.list_tools()
+    assert mock_load_tools.call_count == 2
 
 @pytest.mark.asyncio
 async def test_get_prompt(mock_client, monkeypatch):
     """Test getting a prompt from the server."""
     # Setup mock for load_mcp_prompt
-    mock_messages = [HumanMessage(content="Hello"), AIMessage(content="Hi")]
-    mock_load_prompt = AsyncMock(return_value=mock_messages)
+    mock_load_prompt = AsyncMock(return_value=MOCK_PROMPT_MESSAGES)
     monkeypatch.setattr("mcpwire.client.load_mcp_prompt", mock_load_prompt)
     
     # Call the method
@@ -365,7 +517,7 @@ async def test_get_prompt(mock_client, monkeypatch):
     
     # Check the result
     mock_load_prompt.assert_called_once_with(mock_client._mcpwire, "test_prompt", {"param": "value"})
-    assert result == mock_messages
+    assert result == MOCK_PROMPT_MESSAGES
 
 @pytest.mark.asyncio
 async def test_call_tool(mock_client):
@@ -381,6 +533,51 @@ async def test_call_tool(mock_client):
     mock_client._mcpwire.call_tool.assert_called_once_with("test_tool", {"param": "value"})
     assert result == mock_result
 
+@pytest.mark.asyncio
+async def test_call_batch(mock_client):
+    """Test that call_batch dispatches each call and preserves result order."""
+    mock_client._mcpwire.call_tool.side_effect = lambda name, args: f"{name}:{args['a'] + args['b']}"
+    mock_client._mcpwire.read_resource.return_value = MagicMock(contents=[])
+
+    results = await mock_client.call_batch([
+        ("tools/call", {"name": "add", "arguments": {"a": 1, "b": 2}}),
+        ("tools/call", {"name": "sum", "arguments": {"a": 3, "b": 4}}),
+        ("resources/read", {"uri": "calc://current"}),
+    ])
+
+    assert results[0] == "add:3"
+    assert results[1] == "sum:7"
+    assert isinstance(results[2], ReadResourceResponse)
+    assert mock_client._mcpwire.call_tool.call_count == 2
+    mock_client._mcpwire.read_resource.assert_called_once_with("calc://current")
+
+@pytest.mark.asyncio
+async def test_call_batch_return_exceptions(mock_client):
+    """Test that failed calls are returned in place when return_exceptions is set."""
+    mock_client._mcpwire.call_tool.side_effect = [RuntimeError("boom"), "ok"]
+
+    results = await mock_client.call_batch([
+        ("tools/call", {"name": "first"}),
+        ("tools/call", {"name": "second"}),
+    ], return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "ok"
+
+@pytest.mark.asyncio
+async def test_call_batch_invalid_call_sends_nothing(mock_client):
+    """Test that an invalid call aborts the whole batch before anything is sent."""
+    with pytest.raises(ValueError) as exc_info:
+        await mock_client.call_batch([
+            ("tools/call", {"name": "add", "arguments": {"a": 1, "b": 2}}),
+            ("tools/delete", {}),
+        ])
+    assert "Unsupported batch method" in str(exc_info.value)
+    with pytest.raises(ValueError) as exc_info:
+        await mock_client.call_batch([("resources/read", {})])
+    assert "Missing 'uri'" in str(exc_info.value)
+    mock_client._mcpwire.call_tool.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_client_as_async_context_manager(monkeypatch):
     """Test using the client as an async context manager."""
@@ -391,7 +588,7 @@ async def test_client_as_async_context_manager(monkeypatch):
     # Create a client and patch its methods
     client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
     client._initialize = mock_initialize
-    client.close = mock_close
+    client.aclose = mock_close
     
     # Use the client as a context manager
     async with client as c:
@@ -402,12 +599,157 @@ async def test_client_as_async_context_manager(monkeypatch):
     # Check that close was called after the context
     mock_close.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_initialize_websocket_transport(monkeypatch):
+    """Test that the websocket transport opens a session over websocket_client."""
+    opened_urls = []
+
+    @asynccontextmanager
+    async def fake_websocket_client(url):
+        opened_urls.append(url)
+        yield MagicMock(), MagicMock()
+
+    session = AsyncMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr("mcp.client.websocket.websocket_client", fake_websocket_client)
+    monkeypatch.setattr("mcpwire.client.ClientSession", MagicMock(return_value=session_cm))
+
+    client = MCPClient(base_url="ws://localhost:8000/ws", transport="websocket")
+    async with client:
+        assert client._mcpwire is session
+        session.initialize.assert_called_once()
+
+    assert opened_urls == ["ws://localhost:8000/ws"]
+
+@pytest.mark.asyncio
+async def test_ping(mock_client):
+    """Test that ping sends a ping and returns the round-trip time."""
+    rtt = await mock_client.ping()
+    mock_client._mcpwire.send_ping.assert_awaited_once()
+    assert rtt >= 0
+
+@pytest.mark.asyncio
+async def test_supports_reflects_server_capabilities(monkeypatch):
+    """Test that supports() answers from the capabilities sent at initialize."""
+    from mcp import types as mcp_types
+
+    @asynccontextmanager
+    async def fake_sse_client(*args, **kwargs):
+        yield MagicMock(), MagicMock()
+
+    session = AsyncMock()
+    session.initialize.return_value = MagicMock(capabilities=mcp_types.ServerCapabilities(
+        tools=mcp_types.ToolsCapability(),
+        resources=mcp_types.ResourcesCapability(subscribe=False),
+    ))
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr("mcpwire.client.sse_client", fake_sse_client)
+    monkeypatch.setattr("mcpwire.client.ClientSession", MagicMock(return_value=session_cm))
+
+    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
+    assert not client.supports("tools/call")
+    async with client:
+        assert client.supports("tools/call")
+        assert client.supports("resources/read")
+        assert not client.supports("resources/subscribe")
+        assert not client.supports("prompts/get")
+    assert not client.supports("tools/call")
+
+@pytest.mark.asyncio
+async def test_initialize_sse_passes_httpx_client_factory(monkeypatch):
+    """Test that a custom httpx client factory is handed to the SSE transport."""
+    seen_kwargs = {}
+
+    @asynccontextmanager
+    async def fake_sse_client(*args, **kwargs):
+        seen_kwargs.update(kwargs)
+        yield MagicMock(), MagicMock()
+
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr("mcpwire.client.sse_client", fake_sse_client)
+    monkeypatch.setattr("mcpwire.client.ClientSession", MagicMock(return_value=session_cm))
+
+    factory = MagicMock()
+    async with MCPClient(base_url=MOCK_SERVER_URL, transport="sse", httpx_client_factory=factory):
+        pass
+
+    assert seen_kwargs == {"httpx_client_factory": factory}
+
+def test_http2_uses_http2_client_factory(monkeypatch):
+    """Test that http2=True selects the HTTP/2 client factory when h2 is installed."""
+    monkeypatch.setattr("mcpwire.client.importlib.util.find_spec", lambda name: MagicMock())
+    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", http2=True)
+    assert client.httpx_client_factory is mcpwire_client._http2_client_factory
+
+    # An explicit factory takes precedence
+    factory = MagicMock()
+    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", http2=True, httpx_client_factory=factory)
+    assert client.httpx_client_factory is factory
+
+def test_http2_client_factory_follows_redirects(monkeypatch):
+    """Test that the HTTP/2 client follows redirects like the MCP library's default client."""
+    async_client = MagicMock()
+    monkeypatch.setattr("mcpwire.client.httpx.AsyncClient", async_client)
+
+    mcpwire_client._http2_client_factory(headers={"X-Test": "1"})
+
+    kwargs = async_client.call_args.kwargs
+    assert kwargs["follow_redirects"] is True
+    assert kwargs["http2"] is True
+    assert kwargs["headers"] == {"X-Test": "1"}
+
+def test_http2_without_h2_falls_back(monkeypatch, caplog):
+    """Test that http2=True falls back to HTTP/1.1 with a warning when h2 is missing."""
+    monkeypatch.setattr("mcpwire.client.importlib.util.find_spec", lambda name: None)
+    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse", http2=True)
+    assert client.httpx_client_factory is None
+    assert "h2" in caplog.text
+
+@pytest.mark.asyncio
+async def test_mcp_session(monkeypatch):
+    """Test that mcp_session builds, connects and closes a client."""
+    mock_initialize = AsyncMock()
+    mock_close = AsyncMock()
+    monkeypatch.setattr(MCPClient, "_initialize", mock_initialize)
+    monkeypatch.setattr(MCPClient, "aclose", mock_close)
+
+    async with mcp_session(base_url=MOCK_SERVER_URL, transport="sse", timeout=5) as client:
+        assert isinstance(client, MCPClient)
+        assert client.base_url == MOCK_SERVER_URL
+        assert client.timeout == 5
+        mock_initialize.assert_called_once()
+        mock_close.assert_not_called()
+
+    mock_close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_aclose_is_idempotent():
+    """Test that aclose releases the session once and tolerates repeat calls."""
+    client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
+    exit_stack = AsyncMock()
+    client._exit_stack = exit_stack
+    client._mcpwire = AsyncMock()
+
+    await client.aclose()
+    await client.aclose()
+
+    exit_stack.aclose.assert_called_once()
+    assert client._exit_stack is None
+    assert client._mcpwire is None
+
 def test_client_as_sync_context_manager():
     """Test that using the client as a sync context manager raises an error."""
     client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
-    with pytest.raises(RuntimeError, match="only supports async context manager usage"):
+    with pytest.raises(RuntimeError) as exc_info:
         with client:
             pass
+    assert "only supports async context manager usage" in str(exc_info.value)
 
 # == MultiServerMCPClient Tests ==
 
@@ -434,29 +776,27 @@ async def test_multi_client_connect_to_server(mock_multi_client):
 async def test_multi_client_get_tools(mock_multi_client):
     """Test getting tools from MultiServerMCPClient."""
     # Setup mock return value
-    mock_tools = [MagicMock(), MagicMock()]
-    mock_multi_client._mcpwire.get_tools = MagicMock(return_value=mock_tools)
+    mock_multi_client._mcpwire.get_tools = MagicMock(return_value=MOCK_TOOLS)
     
     # Call the get_tools method - synchronous method
     result = mock_multi_client.get_tools()
     
     # Check the result
     mock_multi_client._mcpwire.get_tools.assert_called_once()
-    assert result == mock_tools
+    assert result == MOCK_TOOLS
 
 @pytest.mark.asyncio
 async def test_multi_client_get_prompt(mock_multi_client):
     """Test getting a prompt from MultiServerMCPClient."""
     # Setup mock return value
-    mock_messages = [HumanMessage(content="Hello"), AIMessage(content="Hi")]
-    mock_multi_client._mcpwire.get_prompt.return_value = mock_messages
+    mock_multi_client._mcpwire.get_prompt.return_value = MOCK_PROMPT_MESSAGES
     
     # Call the get_prompt method
     result = await mock_multi_client.get_prompt("server_name", "prompt_name", {"param": "value"})
     
     # Check the result
     mock_multi_client._mcpwire.get_prompt.assert_called_once_with("server_name", "prompt_name", {"param": "value"})
-    assert result == mock_messages
+    assert result == MOCK_PROMPT_MESSAGES
 
 @pytest.mark.asyncio
 async def test_multi_client_as_async_context_manager(mock_multi_client):
@@ -493,15 +833,17 @@ async def test_mcp_connection_error(mock_exit_stack_class, mock_sse_client):
     
     # Create client and attempt to initialize
     client = MCPClient(base_url=MOCK_SERVER_URL, transport="sse")
-    with pytest.raises(MCPConnectionError, match="Connection failed"):
+    with pytest.raises(MCPConnectionError) as exc_info:
         await client._initialize()
+    assert "Connection failed" in str(exc_info.value)
 
 @pytest.mark.asyncio
 async def test_missing_base_url_for_sse():
     """Test that missing base_url for SSE raises an error."""
     client = MCPClient(transport="sse", base_url=None)
-    with pytest.raises(MCPConnectionError, match="Base URL is required for SSE transport"):
+    with pytest.raises(MCPConnectionError) as exc_info:
         await client._initialize()
+    assert "Base URL is required for SSE transport" in str(exc_info.value)
 
 # == Resource Tests ==
 
@@ -534,6 +876,18 @@ async def test_list_resources(mock_client, mock_resources, mock_resource_templat
     assert result.templates[0].name == mock_resource_templates[0].name
     assert result.templates[0].description == mock_resource_templates[0].description
 
+@pytest.mark.asyncio
+async def test_iter_resources_follows_cursor(mock_client, mock_resources):
+    """Test that iter_resources pages through the catalog using nextCursor."""
+    first_page = MagicMock(resources=mock_resources[:1], nextCursor="page-2")
+    second_page = MagicMock(resources=mock_resources[1:], nextCursor=None)
+    mock_client._mcpwire.list_resources.side_effect = [first_page, second_page]
+
+    result = [resource async for resource in mock_client.iter_resources()]
+
+    assert [r.uri for r in result] == [r.uri for r in mock_resources]
+    assert mock_client._mcpwire.list_resources.call_args_list[1].args == ("page-2",)
+
 @pytest.mark.asyncio
 async def test_read_resource(mock_client, mock_resource_contents):
     """Test reading a resource."""
@@ -561,38 +915,79 @@ async def test_read_resource(mock_client, mock_resource_contents):
     assert result.contents[1].blob == mock_resource_contents[1].blob
 
 @pytest.mark.asyncio
-async def test_read_resource_error(mock_client):
-    """Test error handling when reading a resource."""
-    # Setup mock to raise exception
-    mock_client._mcpwire.read_resource.side_effect = Exception("Failed to read resource")
-    
-    # Call the method and expect exception
-    with pytest.raises(MCPAPIError, match="Failed to read resource"):
-        await mock_client.read_resource("invalid:///uri")
+async def test_read_resource_parse_json(mock_client):
+    """Test that parse=True decodes JSON contents and leaves other types alone."""
+    mock_client._mcpwire.read_resource.return_value = MagicMock(contents=[
+        ResourceContent(uri="calc://timestamp/1", mime_type="application/json", text='{"timestamp": 1}'),
+        ResourceContent(uri="calc://current", mime_type="text/plain", text="42"),
+    ])
+
+    result = await mock_client.read_resource("calc://timestamp/1", parse=True)
+
+    assert result.contents[0].data == {"timestamp": 1}
+    assert result.contents[1].data is None
+
+@pytest.mark.asyncio
+async def test_read_resource_parse_invalid_json(mock_client):
+    """Test that undecodable JSON content raises MCPDataError."""
+    mock_client._mcpwire.read_resource.return_value = MagicMock(contents=[
+        ResourceContent(uri="calc://timestamp/1", mime_type="application/json", text="not json"),
+    ])
+
+    with pytest.raises(MCPDataError) as exc_info:
+        await mock_client.read_resource("calc://timestamp/1", parse=True)
+    assert "Invalid JSON in resource calc://timestamp/1" in str(exc_info.value)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, session_method, args, message", [
+    ("ping", "send_ping", (), "Failed to ping server"),
+    ("list_resources", "list_resources", (), "Failed to list resources"),
+    ("read_resource", "read_resource", ("invalid:///uri",), "Failed to read resource"),
+    ("subscribe_to_resource", "subscribe_resource", ("invalid:///uri",), "Failed to subscribe to resource"),
+    ("unsubscribe_from_resource", "unsubscribe_resource", ("invalid:///uri",), "Failed to unsubscribe from resource"),
+])
+async def test_session_error_raises_api_error(mock_client, method, session_method, args, message):
+    """Test that a failing session call is raised as MCPAPIError."""
+    getattr(mock_client._mcpwire, session_method).side_effect = Exception("boom")
+    with pytest.raises(MCPAPIError) as exc_info:
+        await getattr(mock_client, method)(*args)
+    assert message in str(exc_info.value)
 
 @pytest.mark.asyncio
 async def test_subscribe_to_resource(mock_client):
     """Test subscribing to a resource."""
     # Setup mock
-    mock_client._mcpwire.subscribe_to_resource.return_value = None
+    mock_client._mcpwire.subscribe_resource.return_value = None
     
     # Call the method
     await mock_client.subscribe_to_resource("file:///workspace/document.txt")
     
     # Check results
-    mock_client._mcpwire.subscribe_to_resource.assert_called_once_with("file:///workspace/document.txt")
+    mock_client._mcpwire.subscribe_resource.assert_called_once_with("file:///workspace/document.txt")
+
+@pytest.mark.asyncio
+async def test_subscribe_without_server_support_is_noop(mock_client, caplog):
+    """Test that subscribing is skipped when the server didn't advertise subscriptions."""
+    mock_client._capabilities = frozenset(("resources/list", "resources/read"))
+
+    await mock_client.subscribe_to_resource("file:///workspace/document.txt")
+    await mock_client.unsubscribe_from_resource("file:///workspace/document.txt")
+
+    mock_client._mcpwire.subscribe_resource.assert_not_called()
+    mock_client._mcpwire.unsubscribe_resource.assert_not_called()
+    assert "does not support resource subscriptions" in caplog.text
 
 @pytest.mark.asyncio
 async def test_unsubscribe_from_resource(mock_client):
     """Test unsubscribing from a resource."""
     # Setup mock
-    mock_client._mcpwire.unsubscribe_from_resource.return_value = None
+    mock_client._mcpwire.unsubscribe_resource.return_value = None
     
     # Call the method
     await mock_client.unsubscribe_from_resource("file:///workspace/document.txt")
     
     # Check results
-    mock_client._mcpwire.unsubscribe_from_resource.assert_called_once_with("file:///workspace/document.txt")
+    mock_client._mcpwire.unsubscribe_resource.assert_called_once_with("file:///workspace/document.txt")
 
 # == MultiServerMCPClient Resource Tests ==
 
@@ -644,8 +1039,8 @@ async def test_multi_client_read_resource(mock_multi_client, mock_resource_conte
 async def test_multi_client_subscribe_to_resource(mock_multi_client):
     """Test subscribing to a resource from a specific server with MultiServerMCPClient."""
     # Setup mock server
-    mock_server = AsyncMock()
-    mock_server.subscribe_to_resource.return_value = None
+    mock_server = AsyncMock(spec=ClientSession)
+    mock_server.subscribe_resource.return_value = None
     
     # Setup get_server to return the mock server
     mock_multi_client._mcpwire.get_server = MagicMock(return_value=mock_server)
@@ -655,14 +1050,14 @@ async def test_multi_client_subscribe_to_resource(mock_multi_client):
     
     # Check results
     mock_multi_client._mcpwire.get_server.assert_called_once_with("math_server")
-    mock_server.subscribe_to_resource.assert_called_once_with("file:///workspace/document.txt")
+    mock_server.subscribe_resource.assert_called_once_with("file:///workspace/document.txt")
 
 @pytest.mark.asyncio
 async def test_multi_client_unsubscribe_from_resource(mock_multi_client):
     """Test unsubscribing from a resource from a specific server with MultiServerMCPClient."""
     # Setup mock server
-    mock_server = AsyncMock()
-    mock_server.unsubscribe_from_resource.return_value = None
+    mock_server = AsyncMock(spec=ClientSession)
+    mock_server.unsubscribe_resource.return_value = None
     
     # Setup get_server to return the mock server
     mock_multi_client._mcpwire.get_server = MagicMock(return_value=mock_server)
@@ -672,7 +1067,35 @@ async def test_multi_client_unsubscribe_from_resource(mock_multi_client):
     
     # Check results
     mock_multi_client._mcpwire.get_server.assert_called_once_with("math_server")
-    mock_server.unsubscribe_from_resource.assert_called_once_with("file:///workspace/document.txt")
+    mock_server.unsubscribe_resource.assert_called_once_with("file:///workspace/document.txt")
+
+@pytest.mark.asyncio
+async def test_multi_client_batch(mock_multi_client, mock_resource_contents):
+    """Test batching resource requests against one server with MultiServerMCPClient."""
+    mock_server = AsyncMock(spec=ClientSession)
+    mock_server.read_resource.return_value = MagicMock(contents=mock_resource_contents)
+    mock_server.subscribe_resource.return_value = None
+    mock_multi_client._mcpwire.get_server = MagicMock(return_value=mock_server)
+
+    uri = "file:///workspace/document.txt"
+    content, subscribed = await mock_multi_client.batch("math_server", [
+        ("resources/read", {"uri": uri}),
+        ("resources/subscribe", {"uri": uri}),
+    ])
+
+    assert isinstance(content, ReadResourceResponse)
+    assert subscribed is None
+    mock_server.read_resource.assert_called_once_with(uri)
+    mock_server.subscribe_resource.assert_called_once_with(uri)
+
+@pytest.mark.asyncio
+async def test_multi_client_batch_server_not_found(mock_multi_client):
+    """Test that batch fails fast for an unknown server."""
+    mock_multi_client._mcpwire.get_server = MagicMock(return_value=None)
+
+    with pytest.raises(ValueError) as exc_info:
+        await mock_multi_client.batch("nonexistent_server", [("resources/list", {})])
+    assert "Server 'nonexistent_server' not found" in str(exc_info.value)
 
 @pytest.mark.asyncio
 async def test_multi_client_server_not_found(mock_multi_client):
@@ -681,6 +1104,7 @@ async def test_multi_client_server_not_found(mock_multi_client):
     mock_multi_client._mcpwire.get_server = MagicMock(return_value=None)
     
     # Call the method and expect exception
-    with pytest.raises(ValueError, match="Server 'nonexistent_server' not found"):
+    with pytest.raises(ValueError) as exc_info:
         await mock_multi_client.list_resources("nonexistent_server")
+    assert "Server 'nonexistent_server' not found" in str(exc_info.value)
 
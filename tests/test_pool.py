@@ -0,0 +1,140 @@
+# mcpwire/tests/test_pool.py
+
+"""
+Unit tests for the MCPClient connection pool.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from mcpwire import MCPClient, MCPConnectionError, ClientPool
+
+MOCK_SERVER_URL = "http://mock-mcp-server.test/v1"
+
+@pytest.fixture
+def patched_client(monkeypatch):
+    """Patches MCPClient so opening and closing don't touch the network."""
+    initialize = AsyncMock()
+    close = AsyncMock()
+    monkeypatch.setattr(MCPClient, "_initialize", initialize)
+    monkeypatch.setattr(MCPClient, "aclose", close)
+    return initialize, close
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_for_same_key(patched_client):
+    """Test that a returned client is handed out again for the same key."""
+    initialize, close = patched_client
+    pool = ClientPool()
+
+    async with pool.acquire(MOCK_SERVER_URL, "sse") as first:
+        pass
+    async with pool.acquire(MOCK_SERVER_URL, "sse") as second:
+        pass
+
+    assert first is second
+    initialize.assert_called_once()
+    close.assert_not_called()
+    await pool.aclose()
+    close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_pool_separates_keys(patched_client):
+    """Test that clients are not shared between different API keys."""
+    pool = ClientPool()
+
+    async with pool.acquire(MOCK_SERVER_URL, "sse", api_key="a") as first:
+        pass
+    async with pool.acquire(MOCK_SERVER_URL, "sse", api_key="b") as second:
+        pass
+
+    assert first is not second
+    await pool.aclose()
+
+@pytest.mark.asyncio
+async def test_pool_separates_constructor_arguments(patched_client):
+    """Test that clients are only shared when the other constructor arguments match."""
+    pool = ClientPool()
+
+    async with pool.acquire(MOCK_SERVER_URL, "sse", timeout=5, default_headers={"X-Trace": "1"}) as first:
+        pass
+    async with pool.acquire(MOCK_SERVER_URL, "sse", timeout=30, default_headers={"X-Trace": "1"}) as second:
+        pass
+    async with pool.acquire(MOCK_SERVER_URL, "sse", timeout=5, default_headers={"X-Trace": "1"}) as third:
+        pass
+
+    assert first is not second
+    assert first is third
+    await pool.aclose()
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_returned(patched_client):
+    """Test that the oldest idle client is closed once max_idle is exceeded."""
+    _, close = patched_client
+    pool = ClientPool(max_idle=1)
+
+    async with pool.acquire("http://one.test", "sse") as first:
+        pass
+    async with pool.acquire("http://two.test", "sse"):
+        pass
+
+    close.assert_called_once()
+    async with pool.acquire("http://one.test", "sse") as again:
+        assert again is not first
+    await pool.aclose()
+
+@pytest.mark.asyncio
+async def test_pool_discards_client_on_error(patched_client):
+    """Test that a client is closed rather than reused if the block raises."""
+    _, close = patched_client
+    pool = ClientPool()
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire(MOCK_SERVER_URL, "sse"):
+            raise RuntimeError("boom")
+
+    close.assert_called_once()
+    assert not pool._idle
+
+@pytest.mark.asyncio
+async def test_pool_propagates_connection_errors(monkeypatch):
+    """Test that a failed connection surfaces to the caller and isn't pooled."""
+    monkeypatch.setattr(MCPClient, "_initialize", AsyncMock(side_effect=MCPConnectionError("Connection failed")))
+    pool = ClientPool()
+
+    with pytest.raises(MCPConnectionError) as exc_info:
+        async with pool.acquire(MOCK_SERVER_URL, "sse"):
+            pass
+    assert "Connection failed" in str(exc_info.value)
+    assert not pool._idle
+
+@pytest.mark.asyncio
+async def test_pool_closes_client_when_open_is_cancelled(patched_client, monkeypatch):
+    """Test that a connection finishing after the caller was cancelled is closed, not orphaned."""
+    _, close = patched_client
+    connecting = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def slow_initialize(self):
+        connecting.set()
+        await finish.wait()
+
+    monkeypatch.setattr(MCPClient, "_initialize", slow_initialize)
+    pool = ClientPool()
+
+    async def borrow():
+        async with pool.acquire(MOCK_SERVER_URL, "sse"):
+            pass
+
+    task = asyncio.create_task(borrow())
+    await connecting.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    finish.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    close.assert_called_once()
+    assert not pool._idle
@@ -0,0 +1,65 @@
+# mcpwire/tests/test_servers.py
+
+"""
+Unit tests for the example math servers, exercised in-process through FastMCP.
+"""
+
+import json
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SERVERS_DIR = Path(__file__).resolve().parent.parent / "servers"
+
+def _load_server(name: str):
+    """Imports a server script from servers/ as a fresh module."""
+    spec = importlib.util.spec_from_file_location(name, SERVERS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def sse_server():
+    """Provides a freshly imported math_server_sse module."""
+    return _load_server("math_server_sse")
+
+@pytest.mark.asyncio
+async def test_sse_server_reads_timestamp_template(sse_server):
+    """Test that the timestamp template resource returns its JSON document."""
+    contents = list(await sse_server.mcp.read_resource("calc://timestamp/123"))
+    assert len(contents) == 1
+    assert contents[0].mime_type == "application/json"
+    assert json.loads(contents[0].content) == {
+        "timestamp": 123,
+        "server_time": 123,
+        "message": "Server received request for timestamp 123",
+    }
+
+@pytest.mark.asyncio
+async def test_sse_server_batch_updates_resources(sse_server):
+    """Test that the batch tool runs each operation and updates history and current result."""
+    _, structured = await sse_server.mcp.call_tool("batch", {"ops": [
+        {"op": "add", "a": 1, "b": 2},
+        {"op": "multiply", "a": 3, "b": 4},
+    ]})
+    assert structured == {"result": [3, 12]}
+
+    history = list(await sse_server.mcp.read_resource("calc://history"))
+    current = list(await sse_server.mcp.read_resource("calc://current"))
+    assert history[0].content == "1 + 2 = 3\n3 * 4 = 12"
+    assert current[0].content == "12"
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bad_op", [
+    {"op": "divide", "a": 1, "b": 2},
+    {"op": "add", "a": 1},
+    {"op": "add", "a": 1, "b": "2"},
+])
+async def test_sse_server_batch_rejects_invalid_ops_before_running(sse_server, bad_op):
+    """Test that an invalid op fails the batch before any op is recorded in history."""
+    with pytest.raises(Exception) as exc_info:
+        await sse_server.mcp.call_tool("batch", {"ops": [{"op": "add", "a": 1, "b": 2}, bad_op]})
+    assert "index 1" in str(exc_info.value)
+
+    assert not sse_server.state.history